@@ -0,0 +1,24 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("commandes", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="commande",
+            name="commandes_c_code_pr_c6bd10_idx",
+        ),
+        migrations.AddIndex(
+            model_name="commande",
+            index=models.Index(
+                fields=["code_projet", "code_fournisseur"],
+                name="commandes_c_code_pr_6665e9_idx",
+            ),
+        ),
+    ]
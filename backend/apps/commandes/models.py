@@ -69,7 +69,8 @@ class Commande(BaseModel):
     class Meta:
         indexes = [
             models.Index(fields=["numero_document"]),
-            models.Index(fields=["code_projet"]),
+            # Also serves the per-project supplier lookups in the sync commands
+            models.Index(fields=["code_projet", "code_fournisseur"]),
             models.Index(fields=["numero_article"]),
         ]
         ordering = ["-date_enregistrement"]
@@ -113,16 +114,14 @@ def create_project_from_commande(sender, instance, created, **kwargs):
 
     # Only attempt to create if the project code exists
     if instance.code_projet:
+        project_details = PROJECT_NAME_MAP.get(instance.code_projet, {})
+
         # Check if project already exists
         project, created = Project.objects.get_or_create(
             code=instance.code_projet,
             defaults={
-                "name": PROJECT_NAME_MAP.get(instance.code_projet, {}).get(
-                    "name", instance.code_projet
-                ),
-                "type": PROJECT_NAME_MAP.get(instance.code_projet, {}).get(
-                    "type", "FORFAIT"
-                ),
+                "name": project_details.get("name", instance.code_projet),
+                "type": project_details.get("type", "FORFAIT"),
                 "description": f"Project created from Commande {instance.numero_document}",
             },
         )
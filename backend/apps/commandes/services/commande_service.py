@@ -6,6 +6,7 @@ import logging
 from apps.core.services.base_service import BaseService
 from apps.core.services.excel_service import ExcelService
 from apps.core.exceptions import ExcelProcessingError
+from apps.dashboard.services.dashboard_service import DashboardService
 from ..models import Commande
 
 # Configure logging
@@ -76,6 +77,7 @@ class CommandeService(BaseService[Commande]):
             logger.error(f"Numeric conversion failed for '{value}': {str(e)}")
             return default
 
+    @DashboardService.bulk_changes()
     def import_from_excel(self, file) -> List[Commande]:
         """
         Import orders from Excel file without skipping duplicates.
@@ -251,6 +253,7 @@ class CommandeService(BaseService[Commande]):
             # Wrap other exceptions
             raise ExcelProcessingError(f"Failed to process Excel file: {str(e)}")
 
+    @DashboardService.bulk_changes()
     @transaction.atomic
     def clear_all_commands(self) -> int:
         """
@@ -271,6 +274,7 @@ class CommandeService(BaseService[Commande]):
             logger.error(f"Error clearing commands: {str(e)}")
             raise
 
+    @DashboardService.bulk_changes()
     @transaction.atomic
     def delete_project_commands(self, project_code: str) -> int:
         """
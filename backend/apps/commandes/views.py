@@ -12,6 +12,7 @@ from .services.commande_service import CommandeService
 from apps.core.exceptions import ExcelProcessingError
 from apps.core.constants import get_project_name
 from apps.core.pagination import FlexiblePageNumberPagination
+from apps.dashboard.services.dashboard_service import DashboardService
 
 
 class CommandeFilter(filters.FilterSet):
@@ -60,7 +61,6 @@ class CommandeViewSet(viewsets.ModelViewSet):
         print(f"Document Number Filter: {request.query_params.get('numero_document')}")
 
         queryset = self.filter_queryset(self.get_queryset())
-        print(f"Filtered Queryset Count: {queryset.count()}")
 
         # Apply pagination
         page = self.paginate_queryset(queryset)
@@ -170,7 +170,8 @@ class CommandeViewSet(viewsets.ModelViewSet):
         DELETE /api/commandes/clear_all/
         """
         try:
-            count, _ = Commande.objects.all().delete()
+            with DashboardService.bulk_changes():
+                count, _ = Commande.objects.all().delete()
             return Response(
                 {"message": f"Successfully deleted all commands", "count": count},
                 status=status.HTTP_200_OK,
@@ -216,7 +217,8 @@ class CommandeViewSet(viewsets.ModelViewSet):
             )
 
         try:
-            count = Commande.objects.filter(code_projet=project_code).delete()[0]
+            with DashboardService.bulk_changes():
+                count = Commande.objects.filter(code_projet=project_code).delete()[0]
             return Response(
                 {
                     "message": f"Successfully deleted all commands for project {project_code}",
@@ -286,7 +288,6 @@ class CommandeViewSet(viewsets.ModelViewSet):
 
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
-        print(f"Filtered queryset count: {queryset.count()}")
         print(f"Filter parameters: {request.query_params}")
 
         page = self.paginate_queryset(queryset)
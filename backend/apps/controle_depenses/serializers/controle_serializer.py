@@ -1,6 +1,7 @@
 # apps/controle_depenses/serializers/controle_serializer.py
 
 from rest_framework import serializers
+from apps.core.serializers import SummaryMetricsSerializer
 from ..models import ControleDepense
 from ..choices import (
     PROJECT_TYPE_CHOICES,
@@ -52,7 +53,7 @@ class ControleDepenseSerializer(serializers.ModelSerializer):
         return data
 
 
-class ControleDepenseMetricsSerializer(serializers.Serializer):
+class ControleDepenseMetricsSerializer(SummaryMetricsSerializer):
     """
     Serializer for controle metrics including both standard and real calculations.
 
@@ -67,6 +68,8 @@ class ControleDepenseMetricsSerializer(serializers.Serializer):
     - depenses_facturees_reel: Real invoiced expenses
     - fin_chantier_reel: Real projected end cost
     - rentabilite_reel: Real profitability ratio
+
+    The metric fields themselves are inherited from SummaryMetricsSerializer.
     """
 
     # Project Information
@@ -76,26 +79,6 @@ class ControleDepenseMetricsSerializer(serializers.Serializer):
         choices=PROJECT_TYPE_CHOICES, default=TYPE_FORFAIT
     )
 
-    # Standard Metrics
-    depenses_engagees = serializers.DecimalField(max_digits=15, decimal_places=2)
-    depenses_facturees = serializers.DecimalField(max_digits=15, decimal_places=2)
-    fin_chantier = serializers.DecimalField(
-        max_digits=15, decimal_places=2, allow_null=True, required=False
-    )
-    rentabilite = serializers.DecimalField(
-        max_digits=15, decimal_places=2, required=False, allow_null=True
-    )
-
-    # Real Metrics
-    depenses_engagees_reel = serializers.DecimalField(max_digits=15, decimal_places=2)
-    depenses_facturees_reel = serializers.DecimalField(max_digits=15, decimal_places=2)
-    fin_chantier_reel = serializers.DecimalField(
-        max_digits=15, decimal_places=2, allow_null=True, required=False
-    )
-    rentabilite_reel = serializers.DecimalField(
-        max_digits=15, decimal_places=2, required=False, allow_null=True
-    )
-
     # Project Values
     prix_vente = serializers.DecimalField(
         max_digits=15, decimal_places=2, allow_null=True, required=False
@@ -109,9 +92,6 @@ class ControleDepenseMetricsSerializer(serializers.Serializer):
     budget_chef_projet_base = serializers.DecimalField(
         max_digits=15, decimal_places=2, allow_null=True, required=False
     )
-    reste_a_depenser = serializers.DecimalField(
-        max_digits=15, decimal_places=2, required=False, allow_null=True
-    )
 
     # Additional Metrics
     fiabilite = serializers.CharField(allow_null=True, required=False)
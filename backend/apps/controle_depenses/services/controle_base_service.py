@@ -5,6 +5,7 @@ from django.db import transaction
 from django.core.exceptions import ValidationError
 from apps.commandes.models import Commande
 from apps.core.services.base_service import BaseService
+from apps.dashboard.services.dashboard_service import DashboardService
 from ..models import ControleDepense
 from apps.core.constants import PROJECT_NAME_MAP, get_project_name, get_project_type
 
@@ -50,20 +51,29 @@ class ControleBaseService(BaseService[ControleDepense]):
                 return False
 
             if not controle.code_projet:
-                commande = Commande.objects.filter(
-                    numero_article=controle.numero_article
-                ).first()
-                logger.debug(f"Found commande for validation: {commande}")
+                code_projet = (
+                    Commande.objects.filter(numero_article=controle.numero_article)
+                    .values_list("code_projet", flat=True)
+                    .first()
+                )
+                logger.debug(f"Found project code for validation: {code_projet}")
 
-                if not commande:
+                if code_projet is None:
                     logger.error(
                         f"No Commande found for article: {controle.numero_article}"
                     )
                     return False
 
-                controle.code_projet = commande.code_projet
+                if not code_projet:
+                    logger.error(
+                        f"Commande for article {controle.numero_article} "
+                        "has a blank project code"
+                    )
+                    return False
+
+                controle.code_projet = code_projet
                 # Get project type from the new mapping
-                project_type = get_project_type(commande.code_projet)
+                project_type = get_project_type(code_projet)
                 controle.type_projet = project_type
                 controle.save()
                 logger.info(
@@ -76,6 +86,7 @@ class ControleBaseService(BaseService[ControleDepense]):
             logger.error(f"Validation error: {str(e)}", exc_info=True)
             return False
 
+    @DashboardService.bulk_changes()
     def sync_controle_depense_records(
         self, numero_article: Optional[str] = None, code_projet: Optional[str] = None
     ) -> None:
@@ -172,10 +183,13 @@ class ControleBaseService(BaseService[ControleDepense]):
             logger.info(f"Updating control data for article: {numero_article}")
 
             if not code_projet:
-                commande = Commande.objects.filter(
-                    numero_article=numero_article
-                ).first()
-                code_projet = commande.code_projet if commande else "UNKNOWN"
+                code_projet = (
+                    Commande.objects.filter(numero_article=numero_article)
+                    .values_list("code_projet", flat=True)
+                    .first()
+                )
+                if code_projet is None:
+                    code_projet = "UNKNOWN"
                 logger.debug(f"Found project code: {code_projet}")
 
             # Get project type from mapping if not provided
@@ -64,22 +64,17 @@ class ControleMetricsService(ControleBaseService):
 
             reste_a_depenser = controle.reste_a_depenser or Decimal("0")
 
-            # Get base metrics
-            (
-                depenses_engagees,
-                depenses_facturees,
-                depenses_engagees_reel,
-                depenses_facturees_reel,
-                _,  # Ignore default reste_a_depenser
-                _,  # Will recalculate fin_chantier
-                _,  # Will recalculate fin_chantier_reel
-                _,  # Will recalculate rentabilite
-                _,  # Will recalculate rentabilite_reel
-            ) = self.calculation_service.get_summary_metrics(
+            # Get base metrics; fin_chantier / rentabilite are recalculated
+            # below with the record's actual reste_a_depenser
+            summary = self.calculation_service.get_summary_metrics(
                 controle.numero_article,
                 controle.code_projet,
                 prix_vente_effectif,  # Pass the effective price
             )
+            depenses_engagees = summary.depenses_engagees
+            depenses_facturees = summary.depenses_facturees
+            depenses_engagees_reel = summary.depenses_engagees_reel
+            depenses_facturees_reel = summary.depenses_facturees_reel
 
             # Calculate fin_chantier values with actual reste_a_depenser
             fin_chantier = self.calculation_service.calculate_fin_chantier(
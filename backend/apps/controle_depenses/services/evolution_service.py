@@ -103,11 +103,17 @@ class EvolutionService(BaseService):
             seen_months = set()
 
             for item in monthly_data:
-                if item["month"] and item["month"].isoformat() not in seen_months:
-                    seen_months.add(item["month"].isoformat())
+                month = item["month"]
+                if not month:
+                    continue
+
+                # Integer pair keys hash cheaper than formatting every month
+                month_key = (month.year, month.month)
+                if month_key not in seen_months:
+                    seen_months.add(month_key)
                     evolution_data.append(
                         {
-                            "date": item["month"].isoformat(),
+                            "date": month.isoformat(),
                             "depenses_facturees": float(
                                 item["depenses_facturees"] or 0
                             ),
@@ -0,0 +1,28 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class QueuedFileHandler(QueueHandler):
+    """
+    File handler that writes from a background thread.
+
+    Records are formatted on the calling thread and pushed onto a queue; a
+    QueueListener drains it into a regular FileHandler, so request threads
+    never wait on disk IO.
+    """
+
+    def __init__(self, filename, mode="a", encoding=None):
+        super().__init__(queue.SimpleQueue())
+        self._file_handler = logging.FileHandler(filename, mode, encoding)
+        self._listener = QueueListener(self.queue, self._file_handler)
+        self._listener.start()
+        atexit.register(self.close)
+
+    def close(self):
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            self._file_handler.close()
+        super().close()
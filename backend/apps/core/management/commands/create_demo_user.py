@@ -5,8 +5,17 @@ class Command(BaseCommand):
     help = 'Create superuser for demo'
 
     def handle(self, *args, **options):
-        if not User.objects.filter(username='admin').exists():
-            User.objects.create_superuser('admin', 'admin@demo.com', 'admin123')
+        user, created = User.objects.get_or_create(
+            username='admin',
+            defaults={
+                'email': 'admin@demo.com',
+                'is_staff': True,
+                'is_superuser': True,
+            },
+        )
+        if created:
+            user.set_password('admin123')
+            user.save(update_fields=['password'])
             self.stdout.write('Demo superuser created: admin/admin123')
         else:
             self.stdout.write('Demo superuser already exists')
@@ -0,0 +1,35 @@
+import orjson
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Native types are encoded in C; anything orjson does not handle itself
+    (Decimal, lazy strings, datetimes) falls back to DRF's JSONEncoder so
+    the output matches the default renderer.
+
+    Differences from JSONRenderer:
+    - NaN and Infinity floats are written as null instead of raising
+    - a requested indent (Accept header or renderer context) is rendered
+      as two spaces, the only indent orjson supports
+    - U+2028/U+2029 are written as-is rather than escaped
+    """
+
+    options = (
+        orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_NON_STR_KEYS
+    )
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, default=JSONEncoder().default, option=options)
@@ -0,0 +1,4 @@
+# backend/apps/core/serializers/__init__.py
+from .calculation_serializer import SummaryMetricsSerializer
+
+__all__ = ["SummaryMetricsSerializer"]
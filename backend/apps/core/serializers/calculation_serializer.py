@@ -0,0 +1,37 @@
+# apps/core/serializers/calculation_serializer.py
+
+from rest_framework import serializers
+
+
+class SummaryMetricsSerializer(serializers.Serializer):
+    """
+    Serializer for the SummaryMetrics dataclass returned by
+    CalculationService.get_summary_metrics.
+
+    Fields read the dataclass attributes by name, so a SummaryMetrics instance
+    (or a dict with the same keys) can be passed directly.
+    """
+
+    # Standard Metrics
+    depenses_engagees = serializers.DecimalField(max_digits=15, decimal_places=2)
+    depenses_facturees = serializers.DecimalField(max_digits=15, decimal_places=2)
+    fin_chantier = serializers.DecimalField(
+        max_digits=15, decimal_places=2, allow_null=True, required=False
+    )
+    rentabilite = serializers.DecimalField(
+        max_digits=15, decimal_places=2, required=False, allow_null=True
+    )
+
+    # Real Metrics
+    depenses_engagees_reel = serializers.DecimalField(max_digits=15, decimal_places=2)
+    depenses_facturees_reel = serializers.DecimalField(max_digits=15, decimal_places=2)
+    fin_chantier_reel = serializers.DecimalField(
+        max_digits=15, decimal_places=2, allow_null=True, required=False
+    )
+    rentabilite_reel = serializers.DecimalField(
+        max_digits=15, decimal_places=2, required=False, allow_null=True
+    )
+
+    reste_a_depenser = serializers.DecimalField(
+        max_digits=15, decimal_places=2, required=False, allow_null=True
+    )
@@ -1,13 +1,54 @@
+from dataclasses import dataclass
 from decimal import Decimal
+from functools import wraps
 from django.db.models import Sum, F, Q, Case, When
 from django.db import models
 import logging
+import time
 from apps.commandes.models import Commande
-from typing import Optional, Tuple
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
+def _safe_calc(func):
+    """
+    Log and time a calculation, falling back to Decimal("0") on error.
+
+    Centralizes the error handling shared by every calculate_* method.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Error in {func.__name__}: {str(e)}")
+            return Decimal("0")
+        finally:
+            logger.debug(
+                f"{func.__name__} took {(time.perf_counter() - start) * 1000:.2f} ms"
+            )
+
+    return wrapper
+
+
+@dataclass(frozen=True, slots=True)
+class SummaryMetrics:
+    """Financial summary metrics for an article / project pair."""
+
+    depenses_engagees: Decimal = Decimal("0")
+    depenses_facturees: Decimal = Decimal("0")
+    depenses_engagees_reel: Decimal = Decimal("0")
+    depenses_facturees_reel: Decimal = Decimal("0")
+    reste_a_depenser: Decimal = Decimal("0")
+    fin_chantier: Decimal = Decimal("0")
+    fin_chantier_reel: Decimal = Decimal("0")
+    rentabilite: Decimal = Decimal("0")
+    rentabilite_reel: Decimal = Decimal("0")
+
+
 class CalculationService:
     """
     Service for handling financial calculations.
@@ -50,6 +91,7 @@ class CalculationService:
         return True
 
     @staticmethod
+    @_safe_calc
     def calculate_depenses_engagees(
         numero_article: Optional[str] = None, code_projet: Optional[str] = None
     ) -> Decimal:
@@ -63,28 +105,25 @@ class CalculationService:
         Returns:
             Decimal: Total committed expenses
         """
-        try:
-            query = Commande.objects.filter(annule="N")
+        query = Commande.objects.filter(annule="N")
 
-            if numero_article:
-                query = query.filter(numero_article=numero_article)
-            if code_projet:
-                query = query.filter(code_projet=code_projet)
+        if numero_article:
+            query = query.filter(numero_article=numero_article)
+        if code_projet:
+            query = query.filter(code_projet=code_projet)
 
-            result = query.aggregate(total=Sum("total_lignes"))
-            total = result["total"] or Decimal("0")
+        result = query.aggregate(total=Sum("total_lignes"))
+        total = result["total"] or Decimal("0")
 
-            logger.info(
-                f"Depenses engagees calculation: Article: {numero_article or 'ALL'}, "
-                f"Project: {code_projet or 'ALL'}, Total: {total}"
-            )
+        logger.info(
+            f"Depenses engagees calculation: Article: {numero_article or 'ALL'}, "
+            f"Project: {code_projet or 'ALL'}, Total: {total}"
+        )
 
-            return total
-        except Exception as e:
-            logger.error(f"Error calculating depenses engagees: {str(e)}")
-            return Decimal("0")
+        return total
 
     @staticmethod
+    @_safe_calc
     def calculate_depenses_facturees(
         numero_article: Optional[str] = None, code_projet: Optional[str] = None
     ) -> Decimal:
@@ -100,36 +139,32 @@ class CalculationService:
         Returns:
             Decimal: Total invoiced expenses
         """
-        try:
-            query = Commande.objects.filter(annule="N")
-
-            if numero_article:
-                query = query.filter(numero_article=numero_article)
-            if code_projet:
-                query = query.filter(code_projet=code_projet)
-
-            result = query.aggregate(
-                total=Sum(
-                    F("prix")
-                    * (F("quantite") - F("quantite_en_cours"))
-                    * Case(
-                        When(cours_change=0, then=1),
-                        default=F("cours_change"),
-                        output_field=models.DecimalField(),
-                    )
+        query = Commande.objects.filter(annule="N")
+
+        if numero_article:
+            query = query.filter(numero_article=numero_article)
+        if code_projet:
+            query = query.filter(code_projet=code_projet)
+
+        result = query.aggregate(
+            total=Sum(
+                F("prix")
+                * (F("quantite") - F("quantite_en_cours"))
+                * Case(
+                    When(cours_change=0, then=1),
+                    default=F("cours_change"),
+                    output_field=models.DecimalField(),
                 )
             )
-            total = result["total"] or Decimal("0")
+        )
+        total = result["total"] or Decimal("0")
 
-            logger.info(
-                f"Depenses facturees calculation: Article: {numero_article or 'ALL'}, "
-                f"Project: {code_projet or 'ALL'}, Total: {total}"
-            )
+        logger.info(
+            f"Depenses facturees calculation: Article: {numero_article or 'ALL'}, "
+            f"Project: {code_projet or 'ALL'}, Total: {total}"
+        )
 
-            return total
-        except Exception as e:
-            logger.error(f"Error calculating depenses facturees: {str(e)}")
-            return Decimal("0")
+        return total
 
     @staticmethod
     def get_reste_a_depenser() -> Decimal:
@@ -137,6 +172,7 @@ class CalculationService:
         return Decimal("0")
 
     @staticmethod
+    @_safe_calc
     def calculate_fin_chantier(
         depenses_engagees: Decimal, reste_a_depenser: Optional[Decimal]
     ) -> Decimal:
@@ -150,19 +186,16 @@ class CalculationService:
         Returns:
             Decimal: Estimated completion cost
         """
-        try:
-            reste = reste_a_depenser or Decimal("0")
-            fin_chantier = depenses_engagees + reste
+        reste = reste_a_depenser or Decimal("0")
+        fin_chantier = depenses_engagees + reste
 
-            logger.info(
-                f"Fin chantier calculation: {depenses_engagees} + {reste} = {fin_chantier}"
-            )
-            return fin_chantier
-        except Exception as e:
-            logger.error(f"Error calculating fin chantier: {str(e)}")
-            return Decimal("0")
+        logger.info(
+            f"Fin chantier calculation: {depenses_engagees} + {reste} = {fin_chantier}"
+        )
+        return fin_chantier
 
     @staticmethod
+    @_safe_calc
     def calculate_rentabilite(
         prix_vente: Optional[Decimal], fin_chantier: Decimal
     ) -> Decimal:
@@ -176,23 +209,19 @@ class CalculationService:
         Returns:
             Decimal: Profitability ratio
         """
-        try:
-            prix = prix_vente or Decimal("0")
+        prix = prix_vente or Decimal("0")
 
-            if fin_chantier == Decimal("0") or prix == Decimal("0"):
-                return Decimal("0")
-
-            try:
-                return fin_chantier / prix
-            except ZeroDivisionError:
-                logger.warning("Division by zero in rentabilite calculation")
-                return Decimal("0")
+        if fin_chantier == Decimal("0") or prix == Decimal("0"):
+            return Decimal("0")
 
-        except Exception as e:
-            logger.error(f"Error calculating rentabilite: {str(e)}")
+        try:
+            return fin_chantier / prix
+        except ZeroDivisionError:
+            logger.warning("Division by zero in rentabilite calculation")
             return Decimal("0")
 
     @staticmethod
+    @_safe_calc
     def calculate_depenses_facturees_reel(
         numero_article: Optional[str] = None, code_projet: Optional[str] = None
     ) -> Decimal:
@@ -206,38 +235,35 @@ class CalculationService:
         Returns:
             Decimal: Total real invoiced expenses
         """
-        try:
-            query = Commande.objects.filter(annule="N")
-
-            if numero_article:
-                query = query.filter(numero_article=numero_article)
-            if code_projet:
-                query = query.filter(code_projet=code_projet)
-
-            result = query.aggregate(
-                total=Sum(
-                    F("quantite_livree")
-                    * F("prix")
-                    * Case(
-                        When(cours_change=0, then=1),
-                        default=F("cours_change"),
-                        output_field=models.DecimalField(),
-                    )
+        query = Commande.objects.filter(annule="N")
+
+        if numero_article:
+            query = query.filter(numero_article=numero_article)
+        if code_projet:
+            query = query.filter(code_projet=code_projet)
+
+        result = query.aggregate(
+            total=Sum(
+                F("quantite_livree")
+                * F("prix")
+                * Case(
+                    When(cours_change=0, then=1),
+                    default=F("cours_change"),
+                    output_field=models.DecimalField(),
                 )
             )
-            total = result["total"] or Decimal("0")
+        )
+        total = result["total"] or Decimal("0")
 
-            logger.info(
-                f"Depenses facturees reel calculation: Article: {numero_article or 'ALL'}, "
-                f"Project: {code_projet or 'ALL'}, Total: {total}"
-            )
+        logger.info(
+            f"Depenses facturees reel calculation: Article: {numero_article or 'ALL'}, "
+            f"Project: {code_projet or 'ALL'}, Total: {total}"
+        )
 
-            return total
-        except Exception as e:
-            logger.error(f"Error calculating depenses facturees reel: {str(e)}")
-            return Decimal("0")
+        return total
 
     @staticmethod
+    @_safe_calc
     def calculate_depenses_engagees_reel(
         numero_article: Optional[str] = None, code_projet: Optional[str] = None
     ) -> Decimal:
@@ -254,57 +280,54 @@ class CalculationService:
         Returns:
             Decimal: Total real committed expenses
         """
-        try:
-            query = Commande.objects.filter(annule="N")
-
-            if numero_article:
-                query = query.filter(numero_article=numero_article)
-            if code_projet:
-                query = query.filter(code_projet=code_projet)
-
-            # Calculate for open status ('O')
-            open_result = query.filter(statut_document="O").aggregate(
-                total=Sum(
-                    F("quantite")
-                    * F("prix")
-                    * Case(
-                        When(cours_change=0, then=1),
-                        default=F("cours_change"),
-                        output_field=models.DecimalField(),
-                    )
+        query = Commande.objects.filter(annule="N")
+
+        if numero_article:
+            query = query.filter(numero_article=numero_article)
+        if code_projet:
+            query = query.filter(code_projet=code_projet)
+
+        # Calculate for open status ('O')
+        open_result = query.filter(statut_document="O").aggregate(
+            total=Sum(
+                F("quantite")
+                * F("prix")
+                * Case(
+                    When(cours_change=0, then=1),
+                    default=F("cours_change"),
+                    output_field=models.DecimalField(),
                 )
             )
-
-            # Calculate for closed status ('C')
-            closed_result = query.filter(statut_document="C").aggregate(
-                total=Sum(
-                    F("quantite_livree")
-                    * F("prix")
-                    * Case(
-                        When(cours_change=0, then=1),
-                        default=F("cours_change"),
-                        output_field=models.DecimalField(),
-                    )
+        )
+
+        # Calculate for closed status ('C')
+        closed_result = query.filter(statut_document="C").aggregate(
+            total=Sum(
+                F("quantite_livree")
+                * F("prix")
+                * Case(
+                    When(cours_change=0, then=1),
+                    default=F("cours_change"),
+                    output_field=models.DecimalField(),
                 )
             )
+        )
 
-            open_total = open_result["total"] or Decimal("0")
-            closed_total = closed_result["total"] or Decimal("0")
-            total = open_total + closed_total
+        open_total = open_result["total"] or Decimal("0")
+        closed_total = closed_result["total"] or Decimal("0")
+        total = open_total + closed_total
 
-            logger.info(
-                f"Depenses engagees reel calculation: Article: {numero_article or 'ALL'}, "
-                f"Project: {code_projet or 'ALL'}, "
-                f"Open Total: {open_total}, Closed Total: {closed_total}, "
-                f"Final Total: {total}"
-            )
+        logger.info(
+            f"Depenses engagees reel calculation: Article: {numero_article or 'ALL'}, "
+            f"Project: {code_projet or 'ALL'}, "
+            f"Open Total: {open_total}, Closed Total: {closed_total}, "
+            f"Final Total: {total}"
+        )
 
-            return total
-        except Exception as e:
-            logger.error(f"Error calculating depenses engagees reel: {str(e)}")
-            return Decimal("0")
+        return total
 
     @staticmethod
+    @_safe_calc
     def calculate_rentabilite_reel(
         prix_vente: Optional[Decimal], fin_chantier_reel: Decimal
     ) -> Decimal:
@@ -318,20 +341,15 @@ class CalculationService:
         Returns:
             Decimal: Real profitability ratio
         """
-        try:
-            prix = prix_vente or Decimal("0")
-
-            if fin_chantier_reel == Decimal("0") or prix == Decimal("0"):
-                return Decimal("0")
+        prix = prix_vente or Decimal("0")
 
-            try:
-                return fin_chantier_reel / prix
-            except ZeroDivisionError:
-                logger.warning("Division by zero in rentabilite reel calculation")
-                return Decimal("0")
+        if fin_chantier_reel == Decimal("0") or prix == Decimal("0"):
+            return Decimal("0")
 
-        except Exception as e:
-            logger.error(f"Error calculating rentabilite reel: {str(e)}")
+        try:
+            return fin_chantier_reel / prix
+        except ZeroDivisionError:
+            logger.warning("Division by zero in rentabilite reel calculation")
             return Decimal("0")
 
     @classmethod
@@ -340,9 +358,7 @@ class CalculationService:
         numero_article: str,
         code_projet: Optional[str] = None,
         prix_vente: Optional[Decimal] = None,
-    ) -> Tuple[
-        Decimal, Decimal, Decimal, Decimal, Decimal, Decimal, Decimal, Decimal, Decimal
-    ]:
+    ) -> SummaryMetrics:
         """
         Calculate all summary metrics for a specific article and optional project.
 
@@ -351,16 +367,7 @@ class CalculationService:
             code_projet: Optional project code filter
 
         Returns:
-            Tuple containing:
-            - depenses_engagees
-            - depenses_facturees
-            - depenses_engagees_reel
-            - depenses_facturees_reel
-            - reste_a_depenser
-            - fin_chantier
-            - fin_chantier_reel
-            - rentabilite
-            - rentabilite_reel
+            SummaryMetrics: All calculated metrics, accessible by attribute name
         """
         try:
             # Calculate base metrics
@@ -406,30 +413,20 @@ class CalculationService:
                 f"Rentabilite Reel: {rentabilite_reel}"
             )
 
-            return (
-                depenses_engagees,
-                depenses_facturees,
-                depenses_engagees_reel,
-                depenses_facturees_reel,
-                reste_a_depenser,
-                fin_chantier,
-                fin_chantier_reel,
-                rentabilite,
-                rentabilite_reel,
+            return SummaryMetrics(
+                depenses_engagees=depenses_engagees,
+                depenses_facturees=depenses_facturees,
+                depenses_engagees_reel=depenses_engagees_reel,
+                depenses_facturees_reel=depenses_facturees_reel,
+                reste_a_depenser=reste_a_depenser,
+                fin_chantier=fin_chantier,
+                fin_chantier_reel=fin_chantier_reel,
+                rentabilite=rentabilite,
+                rentabilite_reel=rentabilite_reel,
             )
 
         except Exception as e:
             logger.error(
                 f"Error calculating summary metrics for {numero_article}: {str(e)}"
             )
-            return (
-                Decimal("0"),
-                Decimal("0"),
-                Decimal("0"),
-                Decimal("0"),
-                Decimal("0"),
-                Decimal("0"),
-                Decimal("0"),
-                Decimal("0"),
-                Decimal("0"),
-            )
+            return SummaryMetrics()
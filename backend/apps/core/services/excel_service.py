@@ -1,8 +1,14 @@
+import io
 import logging
+from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pandas as pd
-from typing import Dict, Any, List, Generator, Optional
+from openpyxl import load_workbook
+from typing import Dict, Any, List, Generator, Iterator, Optional
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from ..exceptions import ExcelProcessingError
+from ..utils.helpers import clean_frame_values
 from ..utils.validators import validate_excel_columns
 from ..constants import (
     REQUIRED_COLUMNS,
@@ -12,12 +18,31 @@ from ..constants import (
 
 logger = logging.getLogger(__name__)
 
+# Prefer the Rust-based calamine parser, which is much faster than openpyxl
+try:
+    from python_calamine import CalamineWorkbook
+
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
+
 
 class ExcelService:
     """Service for handling Excel file processing and validation."""
 
     CHUNK_SIZE = 5000
 
+    # Known text date formats, tried in order (same as helpers.parse_date)
+    DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y")
+    DATE_SAMPLE_SIZE = 100
+
+    CATEGORICAL_COLUMNS = (
+        "Code du projet",
+        "Statut document",
+        "Code client/fournisseur",
+        "ItemCode",
+    )
+
     # Column name variations mapping
     COLUMN_VARIATIONS = {
         "project_code": ["Code du projet"],
@@ -34,19 +59,26 @@ class ExcelService:
         "total_after_discount": ["Total après remise"],
     }
 
-    @classmethod
-    def _normalize_column_name(cls, column: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_column_name(column: str) -> str:
         """Normalize column names for consistent matching."""
         if not isinstance(column, str):
             return ""
         return column.strip().lower().replace("'", "'").replace(" ", "")
 
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _get_normalized_columns(cls, columns: tuple) -> Dict[str, str]:
+        """Map normalized column names to actual names, cached per header row."""
+        return {cls._normalize_column_name(col): col for col in columns}
+
     @classmethod
     def _find_matching_column(
         cls, df: pd.DataFrame, variations: List[str]
     ) -> Optional[str]:
         """Find actual column name from variations."""
-        df_columns = {cls._normalize_column_name(col): col for col in df.columns}
+        df_columns = cls._get_normalized_columns(tuple(df.columns))
         logger.debug(f"Normalized columns: {df_columns}")
 
         for variation in variations:
@@ -55,30 +87,161 @@ class ExcelService:
                 return df_columns[normalized_var]
         return None
 
+    @staticmethod
+    def _calamine_value(value):
+        """Normalize a calamine cell the way pandas' calamine reader does."""
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, date) and not isinstance(value, datetime):
+            return datetime(value.year, value.month, value.day)
+        if value == "":
+            return None
+        return value
+
+    @classmethod
+    def _calamine_rows(cls, sheet) -> Iterator[tuple]:
+        """Yield normalized row tuples from a calamine sheet."""
+        for row in sheet.iter_rows():
+            yield tuple(map(cls._calamine_value, row))
+
+    @staticmethod
+    def _frame_from_rows(rows: Iterator[tuple]) -> pd.DataFrame:
+        """
+        Build a DataFrame column by column from streamed row tuples.
+
+        The first row is the header. Rows with no values are skipped, as
+        pandas.read_excel does.
+        """
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+
+        width = len(header)
+        values = [[] for _ in range(width)]
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            if len(row) < width:
+                row = row + (None,) * (width - len(row))
+            for column_values, value in zip(values, row):
+                column_values.append(value)
+
+        df = pd.DataFrame(dict(enumerate(values)))
+        df.columns = [
+            name if name is not None else f"Unnamed: {i}"
+            for i, name in enumerate(header)
+        ]
+        return df
+
+    @staticmethod
+    def _open_source(file: InMemoryUploadedFile):
+        """
+        Return a source that each reader can open on its own.
+
+        Large uploads that Django already spooled to disk are read from their
+        path; smaller ones are buffered into memory once.
+        """
+        if hasattr(file, "temporary_file_path"):
+            return file.temporary_file_path()
+        file.seek(0)
+        return file.read()
+
+    @staticmethod
+    def _as_handle(source):
+        """Wrap buffered bytes in a fresh BytesIO; paths are used as is."""
+        return io.BytesIO(source) if isinstance(source, bytes) else source
+
+    @staticmethod
+    def _select_sheets(
+        available: List[str], sheet_names: Optional[List[str]]
+    ) -> List[str]:
+        """Keep the requested sheets that exist, or the first sheet by default."""
+        if sheet_names:
+            return [name for name in sheet_names if name in available]
+        return available[:1]
+
+    @classmethod
+    def _open_calamine(cls, source):
+        """Open a new calamine workbook on the source."""
+        if isinstance(source, bytes):
+            return CalamineWorkbook.from_filelike(cls._as_handle(source))
+        return CalamineWorkbook.from_path(source)
+
+    @classmethod
+    def _read_calamine_sheet(cls, source, sheet_name: str) -> pd.DataFrame:
+        """Stream one sheet's rows from calamine straight into a DataFrame."""
+        workbook = cls._open_calamine(source)
+        try:
+            sheet = workbook.get_sheet_by_name(sheet_name)
+            return cls._frame_from_rows(cls._calamine_rows(sheet))
+        finally:
+            workbook.close()
+
+    @classmethod
+    def _read_sheets(
+        cls, file: InMemoryUploadedFile, sheet_names: Optional[List[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Parse the requested sheets (the first sheet by default).
+
+        Missing sheets are skipped. Rows are streamed from calamine (or a
+        read-only openpyxl workbook) into columns, without going through
+        pandas.read_excel's text parser or loading the full XML DOM.
+        """
+        source = cls._open_source(file)
+
+        if EXCEL_ENGINE == "calamine":
+            workbook = cls._open_calamine(source)
+            try:
+                names = cls._select_sheets(workbook.sheet_names, sheet_names)
+            finally:
+                workbook.close()
+            if len(names) < 2:
+                return {name: cls._read_calamine_sheet(source, name) for name in names}
+
+            # Parse sheets concurrently; calamine does the work in Rust. Each
+            # worker opens its own workbook since they are not thread-safe.
+            with ThreadPoolExecutor(max_workers=len(names)) as executor:
+                futures = {
+                    name: executor.submit(cls._read_calamine_sheet, source, name)
+                    for name in names
+                }
+                return {name: future.result() for name, future in futures.items()}
+
+        workbook = load_workbook(cls._as_handle(source), read_only=True, data_only=True)
+        try:
+            names = cls._select_sheets(workbook.sheetnames, sheet_names)
+            return {
+                name: cls._frame_from_rows(workbook[name].iter_rows(values_only=True))
+                for name in names
+            }
+        finally:
+            workbook.close()
+
+    @classmethod
+    def _read_sheet(
+        cls, file: InMemoryUploadedFile, sheet_name: Optional[str] = None
+    ) -> pd.DataFrame:
+        """Parse a single sheet (the first one by default) in one pass."""
+        sheets = cls._read_sheets(file, [sheet_name] if sheet_name else None)
+        if not sheets:
+            raise ExcelProcessingError(f"Sheet '{sheet_name}' not found")
+        return next(iter(sheets.values()))
+
     @classmethod
     def read_excel_in_chunks(
         cls, file: InMemoryUploadedFile, sheet_name: str = None
     ) -> Generator[pd.DataFrame, None, None]:
-        """Read large Excel files in chunks to manage memory."""
+        """
+        Read an Excel sheet and yield it in CHUNK_SIZE-row DataFrames.
+
+        The sheet is parsed once: XLSX readers cannot seek to a row, so
+        re-reading with skiprows would re-parse the whole file per chunk.
+        """
         try:
-            excel_file = pd.ExcelFile(file)
-
-            # If no sheet name specified, use the first sheet
-            if sheet_name is None:
-                sheet_name = excel_file.sheet_names[0]
-
-            for chunk_start in range(0, cls.CHUNK_SIZE, cls.CHUNK_SIZE):
-                try:
-                    df_chunk = pd.read_excel(
-                        excel_file,
-                        sheet_name=sheet_name,
-                        skiprows=chunk_start,
-                        nrows=cls.CHUNK_SIZE,
-                    )
-                    if not df_chunk.empty:
-                        yield df_chunk
-                except:
-                    break
+            df = cls._read_sheet(file, sheet_name)
+            for chunk_start in range(0, len(df), cls.CHUNK_SIZE):
+                yield df.iloc[chunk_start : chunk_start + cls.CHUNK_SIZE]
 
         except Exception as e:
             logger.error(f"Error reading Excel file in chunks: {str(e)}")
@@ -88,11 +251,7 @@ class ExcelService:
     def read_excel(cls, file: InMemoryUploadedFile) -> pd.DataFrame:
         """Read Excel file with standard validation."""
         try:
-            chunks = []
-            for chunk in cls.read_excel_in_chunks(file):
-                chunks.append(chunk)
-
-            df = pd.concat(chunks, ignore_index=True)
+            df = cls._read_sheet(file)
             validate_excel_columns(df.columns.tolist())
             return df.dropna(how="all")
 
@@ -106,26 +265,13 @@ class ExcelService:
     ) -> Dict[str, pd.DataFrame]:
         """Read Excel file with multiple sheets."""
         try:
-            excel_file = pd.ExcelFile(file)
             sheets = {}
 
-            for sheet_name in ["Facturation", "Avancement"]:
-                chunks = []
-                for chunk_start in range(0, cls.CHUNK_SIZE, cls.CHUNK_SIZE):
-                    try:
-                        df_chunk = pd.read_excel(
-                            excel_file,
-                            sheet_name=sheet_name,
-                            skiprows=chunk_start,
-                            nrows=cls.CHUNK_SIZE,
-                        )
-                        if not df_chunk.empty:
-                            chunks.append(df_chunk)
-                    except:
-                        break
-
-                if chunks:
-                    sheets[sheet_name] = pd.concat(chunks, ignore_index=True)
+            for sheet_name, df in cls._read_sheets(
+                file, ["Facturation", "Avancement"]
+            ).items():
+                if not df.empty:
+                    sheets[sheet_name] = df
                     logger.info(
                         f"Successfully read {sheet_name} sheet. Columns: {sheets[sheet_name].columns.tolist()}"
                     )
@@ -139,34 +285,74 @@ class ExcelService:
             )
 
     @classmethod
-    def clean_data(cls, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and prepare DataFrame for processing."""
+    def _detect_date_format(cls, series: pd.Series) -> Optional[str]:
+        """
+        Detect the date format of a text column from a sample of its values.
+
+        Returns None (let pandas infer) when the column is already parsed or
+        no single known format matches the whole sample.
+        """
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return None
+
+        sample = series.dropna().head(cls.DATE_SAMPLE_SIZE).astype(str)
+        if sample.empty:
+            return None
+
+        for date_format in cls.DATE_FORMATS:
+            parsed = pd.to_datetime(sample, format=date_format, errors="coerce")
+            if parsed.notna().all():
+                return date_format
+        return None
+
+    @classmethod
+    def clean_data(cls, df: pd.DataFrame, *, inplace: bool = False) -> pd.DataFrame:
+        """
+        Clean and prepare DataFrame for processing.
+
+        Pass inplace=True when the caller no longer needs the raw frame, to
+        avoid copying the whole sheet.
+        """
         try:
-            # Create a copy to avoid modifying the original
-            cleaned_df = df.copy()
+            cleaned_df = df if inplace else df.copy()
 
             # Convert date columns
             date_columns = ["Date d'enregistrement", "Date comptable", "Dat"]
             for col in date_columns:
                 if col in cleaned_df.columns:
-                    cleaned_df[col] = pd.to_datetime(cleaned_df[col], errors="coerce")
+                    cleaned_df[col] = pd.to_datetime(
+                        cleaned_df[col],
+                        format=cls._detect_date_format(cleaned_df[col]),
+                        errors="coerce",
+                        cache=True,
+                    )
 
             # Convert numeric columns
             numeric_columns = [
-                "Quantity",
-                "Price",
-                "LineTotal",
-                "Payment HT",
-                "Payement TTC",
+                col
+                for col in ["Quantity", "Price", "LineTotal", "Payment HT", "Payement TTC"]
+                if col in cleaned_df.columns
             ]
-            for col in numeric_columns:
-                if col in cleaned_df.columns:
-                    cleaned_df[col] = pd.to_numeric(cleaned_df[col], errors="coerce")
+            if numeric_columns:
+                cleaned_df[numeric_columns] = cleaned_df[numeric_columns].apply(
+                    pd.to_numeric, errors="coerce"
+                )
+
+            # Store whole-number quantities in the smallest integer dtype.
+            # Monetary columns stay float64: they end up in DecimalFields with
+            # 15 digits, which float32 (~7 significant digits) cannot hold.
+            if "Quantity" in cleaned_df.columns:
+                cleaned_df["Quantity"] = pd.to_numeric(
+                    cleaned_df["Quantity"], downcast="integer"
+                )
+
+            # Strip whitespace from string columns; blank cells become None
+            clean_frame_values(cleaned_df)
 
-            # Strip whitespace from string columns
-            string_columns = cleaned_df.select_dtypes(include=["object"]).columns
-            for col in string_columns:
-                cleaned_df[col] = cleaned_df[col].astype(str).str.strip()
+            # Low-cardinality code columns are stored as integer-coded categories
+            for col in cls.CATEGORICAL_COLUMNS:
+                if col in cleaned_df.columns:
+                    cleaned_df[col] = cleaned_df[col].astype("category")
 
             return cleaned_df
 
@@ -180,8 +366,9 @@ class ExcelService:
         errors = []
 
         # Check for missing required columns
+        columns = set(df.columns)
         for req_col in REQUIRED_COLUMNS:
-            if req_col not in df.columns:
+            if req_col not in columns:
                 errors.append(
                     {
                         "column": req_col,
@@ -189,17 +376,11 @@ class ExcelService:
                     }
                 )
 
-        # Validate numeric constraints
-        numeric_constraints = {"Quantity": lambda x: x >= 0, "Price": lambda x: x >= 0}
-
-        for col, constraint in numeric_constraints.items():
+        # Validate numeric constraints (values must be non-negative)
+        for col in ["Quantity", "Price"]:
             if col in df.columns:
-                invalid_values = df[
-                    df[col].apply(
-                        lambda x: not constraint(float(x)) if pd.notna(x) else False
-                    )
-                ]
-                if not invalid_values.empty:
+                values = pd.to_numeric(df[col], errors="coerce").to_numpy()
+                if (values < 0).any():
                     errors.append(
                         {
                             "column": col,
@@ -215,7 +396,7 @@ class ExcelService:
     ) -> pd.DataFrame:
         """Process single Excel file with validation."""
         df = cls.read_excel(file)
-        df = cls.clean_data(df)
+        df = cls.clean_data(df, inplace=True)
 
         if validate:
             errors = cls.validate_data(df)
@@ -235,7 +416,7 @@ class ExcelService:
             # Clean data in each sheet
             cleaned_sheets = {}
             for sheet_name, df in sheets.items():
-                cleaned_df = cls.clean_data(df)
+                cleaned_df = cls.clean_data(df, inplace=True)
                 cleaned_sheets[sheet_name] = cleaned_df
                 logger.info(
                     f"Cleaned {sheet_name} sheet. Columns: {cleaned_df.columns.tolist()}"
@@ -243,17 +424,26 @@ class ExcelService:
 
             if validate:
                 # Validate project code existence and non-emptiness
-                for sheet_name, df in cleaned_sheets.items():
-                    project_col = "Code du projet"  # Use exact column name
-                    if project_col not in df.columns:
-                        raise ExcelProcessingError(
-                            f"Missing project code column '{project_col}' in {sheet_name} sheet. "
-                            f"Available columns: {df.columns.tolist()}"
-                        )
+                project_col = "Code du projet"  # Use exact column name
+                missing = [
+                    f"{sheet_name} (available columns: {df.columns.tolist()})"
+                    for sheet_name, df in cleaned_sheets.items()
+                    if project_col not in df.columns
+                ]
+                if missing:
+                    raise ExcelProcessingError(
+                        f"Missing project code column '{project_col}' in sheets: "
+                        f"{'; '.join(missing)}"
+                    )
 
-                    if df[project_col].isnull().any() or df[project_col].eq("").any():
+                # clean_data turns blank strings into None, so isna() covers them
+                for sheet_name, df in cleaned_sheets.items():
+                    empty = df[project_col].isna()
+                    if empty.any():
+                        # +2: DataFrame index is 0-based and row 1 is the header
                         raise ExcelProcessingError(
-                            f"Empty project code found in {sheet_name} sheet"
+                            f"Empty project code found in {sheet_name} sheet "
+                            f"at row {df.index[empty][0] + 2}"
                         )
 
             return cleaned_sheets
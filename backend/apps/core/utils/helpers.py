@@ -3,6 +3,7 @@
 from typing import Dict, Any
 from decimal import Decimal
 from datetime import datetime
+import pandas as pd
 
 def format_currency(
     amount: Decimal,
@@ -35,13 +36,32 @@ def parse_date(date_str: str) -> datetime:
     Raises:
         ValueError: If date string cannot be parsed
     """
+    # Each format can only match strings with its own separator, so pick it
+    # by separator instead of trying both
+    if "-" in date_str:
+        date_format = "%Y-%m-%d"
+    elif "/" in date_str:
+        date_format = "%d/%m/%Y"
+    else:
+        raise ValueError(f"Unable to parse date: {date_str}")
+
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d")
+        return datetime.strptime(date_str, date_format)
     except ValueError:
-        try:
-            return datetime.strptime(date_str, "%d/%m/%Y")
-        except ValueError:
-            raise ValueError(f"Unable to parse date: {date_str}")
+        raise ValueError(f"Unable to parse date: {date_str}")
+
+def parse_date_series(dates: pd.Series) -> pd.Series:
+    """
+    Vectorized parse_date for a whole column of date strings.
+    
+    Args:
+        dates: Series of date strings (YYYY-MM-DD or DD/MM/YYYY)
+        
+    Returns:
+        pd.Series: datetime64 series, NaT where a value cannot be parsed
+    """
+    iso = pd.to_datetime(dates, format="%Y-%m-%d", errors="coerce")
+    return iso.fillna(pd.to_datetime(dates, format="%d/%m/%Y", errors="coerce"))
 
 def clean_dict_values(data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -53,10 +73,26 @@ def clean_dict_values(data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dict: Cleaned dictionary
     """
-    cleaned = {}
-    for key, value in data.items():
-        if isinstance(value, str):
-            cleaned[key] = value.strip() or None
-        else:
-            cleaned[key] = value
-    return cleaned
\ No newline at end of file
+    return {
+        key: (value.strip() or None) if isinstance(value, str) else value
+        for key, value in data.items()
+    }
+
+def clean_frame_values(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Column-wise clean_dict_values for DataFrames.
+    
+    Strips whitespace from text columns and converts empty strings to None,
+    leaving missing values missing. The DataFrame is modified in place.
+    
+    Args:
+        df: DataFrame to clean
+        
+    Returns:
+        pd.DataFrame: The cleaned DataFrame
+    """
+    for col in df.select_dtypes(include=["object"]).columns:
+        values = df[col]
+        stripped = values.astype(str).str.strip()
+        df[col] = stripped.where(values.notna() & stripped.ne(""), None)
+    return df
@@ -2,6 +2,7 @@
 
 from decimal import Decimal
 from typing import List, Dict, Any
+import pandas as pd
 from ..exceptions import ValidationError
 from ..constants import REQUIRED_COLUMNS
 
@@ -18,7 +19,8 @@ def validate_excel_columns(headers: List[str]) -> bool:
     Raises:
         ValidationError: If any required columns are missing
     """
-    missing_columns = [col for col in REQUIRED_COLUMNS if col not in headers]
+    header_set = set(headers)
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in header_set]
     if missing_columns:
         raise ValidationError(
             f"Missing required columns: {', '.join(missing_columns)}"
@@ -39,10 +41,41 @@ def validate_decimal_value(value: Any, field_name: str) -> Decimal:
     Raises:
         ValidationError: If value cannot be converted to Decimal
     """
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, int) and not isinstance(value, bool):
+        return Decimal(value)
+
     try:
-        decimal_value = Decimal(str(value))
-        return decimal_value
+        if isinstance(value, float):
+            # repr() gives the shortest round-tripping form, e.g. 0.1 -> "0.1"
+            return Decimal(repr(value))
+        return Decimal(str(value).strip())
     except (TypeError, ValueError, ArithmeticError):
         raise ValidationError(
             f"Invalid decimal value for {field_name}: {value}"
-        )
\ No newline at end of file
+        )
+
+def validate_decimal_series(values: pd.Series, field_name: str) -> pd.Series:
+    """
+    Validates that a whole column is numeric, without building Decimals.
+    
+    Convert to Decimal only at the model/serializer boundary.
+    
+    Args:
+        values: Series to validate
+        field_name: Name of the field being validated
+        
+    Returns:
+        pd.Series: Numeric series (missing values stay NaN)
+        
+    Raises:
+        ValidationError: If any non-missing value is not numeric
+    """
+    numeric = pd.to_numeric(values, errors="coerce")
+    invalid = numeric.isna() & values.notna()
+    if invalid.any():
+        raise ValidationError(
+            f"Invalid decimal value for {field_name}: {values[invalid].iloc[0]}"
+        )
+    return numeric
\ No newline at end of file
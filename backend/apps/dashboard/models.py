@@ -1,7 +1,11 @@
 # backend/apps/dashboard/models.py
 
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from apps.core.models import BaseModel
+from apps.commandes.models import Commande
+from apps.controle_depenses.models import ControleDepense
 
 class DashboardPreference(BaseModel):
     """
@@ -22,4 +26,17 @@ class DashboardPreference(BaseModel):
     )
 
     class Meta:
-        unique_together = ['user']
\ No newline at end of file
+        unique_together = ['user']
+
+
+@receiver([post_save, post_delete], sender=Commande)
+@receiver([post_save, post_delete], sender=ControleDepense)
+def invalidate_dashboard_cache(sender, **kwargs):
+    """
+    Expire cached dashboard metrics when the underlying data changes, unless
+    a bulk write will invalidate once when it finishes
+    """
+    from .services.dashboard_service import DashboardService
+
+    if not DashboardService.invalidation_deferred():
+        DashboardService.invalidate_cache()
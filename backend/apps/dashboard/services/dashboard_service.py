@@ -1,16 +1,81 @@
+import threading
+from contextlib import contextmanager
 from typing import Dict, List
 from decimal import Decimal
+from functools import wraps
+from django.core.cache import cache
+from django.db import transaction
 from django.db.models import Sum, Count, Avg
 from apps.commandes.models import Commande
 from apps.controle_depenses.models import ControleDepense
 
+CACHE_TIMEOUT = 60  # seconds
+CACHE_VERSION_KEY = "dashboard:version"
+ITERATOR_CHUNK_SIZE = 2000
+
+# Depth of nested DashboardService.bulk_changes() blocks on this thread
+_bulk_state = threading.local()
+
+
+def cached(prefix: str, timeout: int = CACHE_TIMEOUT):
+    """
+    Cache a DashboardService method's result, keyed on prefix and arguments.
+
+    Entries are stored under the current dashboard cache version so that
+    DashboardService.invalidate_cache() expires all of them at once.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args):
+            key = ":".join(["dashboard", prefix, *map(str, args)])
+            version = cache.get_or_set(CACHE_VERSION_KEY, 1, None)
+            return cache.get_or_set(key, lambda: func(*args), timeout, version=version)
+
+        return wrapper
+
+    return decorator
+
 
 class DashboardService:
     """
     Service for generating dashboard data and analytics.
+
+    Results are cached for CACHE_TIMEOUT seconds and invalidated whenever a
+    Commande or ControleDepense is saved or deleted; bulk writes wrapped in
+    bulk_changes() invalidate once instead of once per row.
     """
 
     @staticmethod
+    def invalidate_cache() -> None:
+        """Expire every cached dashboard result."""
+        try:
+            cache.incr(CACHE_VERSION_KEY)
+        except ValueError:
+            cache.set(CACHE_VERSION_KEY, 1, None)
+
+    @staticmethod
+    def invalidation_deferred() -> bool:
+        """Whether a bulk_changes() block is open on this thread."""
+        return getattr(_bulk_state, "depth", 0) > 0
+
+    @staticmethod
+    @contextmanager
+    def bulk_changes():
+        """
+        Skip the per-row invalidation signals for the duration of a bulk write,
+        then expire the cache once (after commit, inside a transaction).
+        """
+        _bulk_state.depth = getattr(_bulk_state, "depth", 0) + 1
+        try:
+            yield
+        finally:
+            _bulk_state.depth -= 1
+            if not _bulk_state.depth:
+                transaction.on_commit(DashboardService.invalidate_cache)
+
+    @staticmethod
+    @cached("kpi")
     def get_kpi_summary() -> Dict:
         """
         Get summary of key performance indicators.
@@ -18,17 +83,19 @@ class DashboardService:
         Returns:
             Dict containing KPI metrics
         """
-        total_commandes = Commande.objects.count()
-        total_amount = Commande.objects.aggregate(total=Sum("total_lignes"))
+        commandes = Commande.objects.aggregate(
+            count=Count("id"), total=Sum("total_lignes")
+        )
         avg_rentabilite = ControleDepense.objects.aggregate(avg=Avg("rentabilite"))
 
         return {
-            "total_commandes": total_commandes,
-            "total_amount": total_amount["total"] or Decimal("0"),
+            "total_commandes": commandes["count"],
+            "total_amount": commandes["total"] or Decimal("0"),
             "avg_rentabilite": avg_rentabilite["avg"] or Decimal("0"),
         }
 
     @staticmethod
+    @cached("expense_distribution")
     def get_expense_distribution() -> List[Dict]:
         """
         Get expense distribution by article type.
@@ -40,9 +107,11 @@ class DashboardService:
             Commande.objects.values("numero_article")
             .annotate(total_expense=Sum("total_lignes"), order_count=Count("id"))
             .order_by("-total_expense")
+            .iterator(chunk_size=ITERATOR_CHUNK_SIZE)
         )
 
     @staticmethod
+    @cached("profitability")
     def get_profitability_analysis() -> List[Dict]:
         """
         Get profitability analysis by article.
@@ -57,9 +126,11 @@ class DashboardService:
                 depenses_total=Sum("commande__total_lignes"),
             )
             .order_by("-prix_vente_total")
+            .iterator(chunk_size=ITERATOR_CHUNK_SIZE)
         )
 
     @staticmethod
+    @cached("project_summary")
     def get_project_summary(code_projet: str) -> Dict:
         """
         Get summary for a specific project.
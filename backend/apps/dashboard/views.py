@@ -50,7 +50,7 @@ class DashboardViewSet(viewsets.ModelViewSet):
         
         GET /api/dashboard/metrics/
         """
-        # Change from await to sync method
+        # Run on the request's connection, so no new connections are opened
         kpi_summary = self.dashboard_service.get_kpi_summary()
         expense_distribution = self.dashboard_service.get_expense_distribution()
         profitability_analysis = self.dashboard_service.get_profitability_analysis()
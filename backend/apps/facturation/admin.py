@@ -9,6 +9,7 @@ from django import forms
 from .models import Facturation, Avancement
 from .services.facturation_import_service import FacturationImportService
 from .services.facturation_analytics_service import FacturationAnalyticsService
+from .tasks import get_import_status, start_facturation_import
 
 
 class ExcelImportForm(forms.Form):
@@ -134,6 +135,11 @@ class FacturationAdmin(admin.ModelAdmin):
                 self.admin_site.admin_view(self.import_excel),
                 name="facturation_import_excel",
             ),
+            path(
+                "import-status/<str:task_id>/",
+                self.admin_site.admin_view(self.import_status),
+                name="facturation_import_status",
+            ),
             path(
                 "delete-project/",
                 self.admin_site.admin_view(self.delete_project),
@@ -153,30 +159,19 @@ class FacturationAdmin(admin.ModelAdmin):
 
         Process:
         1. Display upload form on GET request
-        2. Process uploaded file on POST request
-        3. Use FacturationImportService to handle the import
-        4. Show success/error messages
-        5. Redirect back to list view
+        2. Save the uploaded file on POST request
+        3. Run FacturationImportService in the background
+        4. Redirect to the import status page
         """
         if request.method == "POST":
             form = ExcelImportForm(request.POST, request.FILES)
             if form.is_valid():
-                import_service = FacturationImportService()
                 try:
-                    # Process the uploaded Excel file
-                    result = import_service.process_excel_import(
-                        request.FILES["excel_file"]
-                    )
-
-                    # Show success message with import counts
-                    self.message_user(
-                        request,
-                        f"Successfully imported {result['facturation_count']} facturation records "
-                        f"and {result['avancement_count']} avancement records",
-                    )
-                    return HttpResponseRedirect("../")
+                    # Import in the background so the request returns at once
+                    task_id = start_facturation_import(request.FILES["excel_file"])
+                    return HttpResponseRedirect(f"../import-status/{task_id}/")
                 except Exception as e:
-                    # Show error message if import fails
+                    # Show error message if the file could not be queued
                     self.message_user(
                         request, f"Error importing file: {str(e)}", level="ERROR"
                     )
@@ -190,6 +185,40 @@ class FacturationAdmin(admin.ModelAdmin):
             {"form": form, "title": "Import Excel File"},
         )
 
+    def import_status(self, request, task_id):
+        """
+        Show the progress of a background Excel import.
+
+        The page refreshes itself while the import is running, then shows
+        a success/error message and redirects back to the list view.
+        """
+        status = get_import_status(task_id)
+
+        if status is None:
+            self.message_user(request, "Unknown or expired import", level="ERROR")
+            return HttpResponseRedirect("../../")
+
+        if status["state"] == "done":
+            result = status["result"]
+            self.message_user(
+                request,
+                f"Successfully imported {result['facturation_count']} facturation records "
+                f"and {result['avancement_count']} avancement records",
+            )
+            return HttpResponseRedirect("../../")
+
+        if status["state"] == "failed":
+            self.message_user(
+                request, f"Error importing file: {status['error']}", level="ERROR"
+            )
+            return HttpResponseRedirect("../../")
+
+        return render(
+            request,
+            "admin/facturation/import_status.html",
+            {"status": status, "title": "Import in progress"},
+        )
+
     def delete_project(self, request):
         """
         Handle project-specific deletion.
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from apps.facturation.tasks import fail_stale_imports
+
+
+class Command(BaseCommand):
+    help = "Mark background imports whose worker stopped as failed"
+
+    def handle(self, *args, **kwargs):
+        failed = fail_stale_imports()
+        self.stdout.write(
+            self.style.SUCCESS(f"Stale imports marked as failed: {failed}")
+        )
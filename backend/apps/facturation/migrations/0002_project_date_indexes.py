@@ -0,0 +1,35 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("facturation", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="avancement",
+            name="facturation_project_dbd76d_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="facturation",
+            name="facturation_project_62ba58_idx",
+        ),
+        migrations.AddIndex(
+            model_name="avancement",
+            index=models.Index(
+                fields=["project_code", "accounting_date"],
+                name="facturation_project_d3ef12_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="facturation",
+            index=models.Index(
+                fields=["project_code", "registration_date"],
+                name="facturation_project_49deb4_idx",
+            ),
+        ),
+    ]
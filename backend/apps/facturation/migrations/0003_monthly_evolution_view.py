@@ -0,0 +1,101 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:38
+
+from django.db import migrations, models
+
+CREATE_VIEW_SQL = """
+CREATE MATERIALIZED VIEW facturation_monthly_mv AS
+SELECT
+    row_number() OVER (ORDER BY series, project_code, month) AS id,
+    series,
+    project_code,
+    month,
+    total,
+    SUM(total) OVER (
+        PARTITION BY series, project_code ORDER BY month
+    ) AS cumulative
+FROM (
+    SELECT
+        'facturation' AS series,
+        project_code,
+        date_trunc('month', registration_date)::date AS month,
+        SUM(total_after_discount) AS total
+    FROM facturation_facturation
+    GROUP BY 1, 2, 3
+    UNION ALL
+    SELECT
+        'avancement' AS series,
+        project_code,
+        date_trunc('month', accounting_date)::date AS month,
+        SUM(payment_ht) AS total
+    FROM facturation_avancement
+    GROUP BY 1, 2, 3
+) AS monthly_totals
+"""
+
+# A unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE_INDEX_SQL = """
+CREATE UNIQUE INDEX facturation_monthly_mv_key
+    ON facturation_monthly_mv (project_code, series, month)
+"""
+
+DROP_VIEW_SQL = "DROP MATERIALIZED VIEW IF EXISTS facturation_monthly_mv"
+
+
+def create_view(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(CREATE_VIEW_SQL)
+        schema_editor.execute(CREATE_INDEX_SQL)
+
+
+def drop_view(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_VIEW_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("facturation", "0002_project_date_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyEvolution",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("series", models.CharField(max_length=20, verbose_name="Série")),
+                (
+                    "project_code",
+                    models.CharField(max_length=50, verbose_name="Code projet"),
+                ),
+                ("month", models.DateField(verbose_name="Mois")),
+                (
+                    "total",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=15, verbose_name="Total"
+                    ),
+                ),
+                (
+                    "cumulative",
+                    models.DecimalField(
+                        decimal_places=2, max_digits=15, verbose_name="Cumul"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Evolution mensuelle",
+                "verbose_name_plural": "Evolutions mensuelles",
+                "db_table": "facturation_monthly_mv",
+                "managed": False,
+            },
+        ),
+        migrations.RunPython(create_view, drop_view),
+    ]
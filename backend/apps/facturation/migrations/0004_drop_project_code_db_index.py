@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-15 22:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("facturation", "0003_monthly_evolution_view"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="avancement",
+            name="project_code",
+            field=models.CharField(max_length=50, verbose_name="Code projet"),
+        ),
+        migrations.AlterField(
+            model_name="facturation",
+            name="project_code",
+            field=models.CharField(max_length=50, verbose_name="Code projet"),
+        ),
+    ]
@@ -1,6 +1,8 @@
 # Path: backend/apps/facturation/models.py
 
-from django.db import models
+import uuid
+
+from django.db import connection, models
 from apps.core.models import BaseModel
 from apps.core.constants import MAX_DIGITS, DECIMAL_PLACES
 
@@ -31,13 +33,11 @@ class Facturation(BaseModel):
         decimal_places=DECIMAL_PLACES,
         verbose_name="Total après remise",
     )
-    project_code = models.CharField(
-        max_length=50, db_index=True, verbose_name="Code projet"
-    )
+    project_code = models.CharField(max_length=50, verbose_name="Code projet")
 
     class Meta:
         indexes = [
-            models.Index(fields=["project_code"]),
+            models.Index(fields=["project_code", "registration_date"]),
             models.Index(fields=["registration_date"]),
         ]
         verbose_name = "Facturation"
@@ -62,9 +62,7 @@ class Avancement(BaseModel):
         verbose_name="Payement TTC",
     )
     payment_method = models.CharField(max_length=50, verbose_name="Méthode de paiement")
-    project_code = models.CharField(
-        max_length=50, db_index=True, verbose_name="Code projet"
-    )
+    project_code = models.CharField(max_length=50, verbose_name="Code projet")
     num = models.CharField(max_length=50, verbose_name="Num", null=True, blank=True)
     total = models.CharField(max_length=50, verbose_name="Total", null=True, blank=True)
     dat = models.DateField(verbose_name="Dat", null=True, blank=True)
@@ -73,7 +71,7 @@ class Avancement(BaseModel):
 
     class Meta:
         indexes = [
-            models.Index(fields=["project_code"]),
+            models.Index(fields=["project_code", "accounting_date"]),
             models.Index(fields=["accounting_date"]),
         ]
         verbose_name = "Avancement"
@@ -81,3 +79,83 @@ class Avancement(BaseModel):
 
     def __str__(self):
         return f"{self.doc_num} - {self.project_code}"
+
+
+class MonthlyEvolution(models.Model):
+    """
+    Monthly cumulative facturation and avancement totals per project.
+
+    Backed by the facturation_monthly_mv materialized view, which only
+    exists on PostgreSQL and is refreshed after imports and deletions.
+    """
+
+    series = models.CharField(max_length=20, verbose_name="Série")
+    project_code = models.CharField(max_length=50, verbose_name="Code projet")
+    month = models.DateField(verbose_name="Mois")
+    total = models.DecimalField(
+        max_digits=MAX_DIGITS, decimal_places=DECIMAL_PLACES, verbose_name="Total"
+    )
+    cumulative = models.DecimalField(
+        max_digits=MAX_DIGITS, decimal_places=DECIMAL_PLACES, verbose_name="Cumul"
+    )
+
+    class Meta:
+        managed = False
+        db_table = "facturation_monthly_mv"
+        verbose_name = "Evolution mensuelle"
+        verbose_name_plural = "Evolutions mensuelles"
+
+    def __str__(self):
+        return f"{self.series} - {self.project_code} - {self.month}"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Materialized views are only created on PostgreSQL"""
+        return connection.vendor == "postgresql"
+
+    @classmethod
+    def refresh(cls) -> None:
+        """Recompute the materialized view from the current records"""
+        if not cls.is_available():
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"REFRESH MATERIALIZED VIEW CONCURRENTLY {cls._meta.db_table}"
+            )
+
+
+class ImportJob(BaseModel):
+    """
+    State of a background Excel import.
+
+    Kept in the database so every web worker sees the same status, and so
+    imports interrupted by a worker restart can be detected and failed.
+    """
+
+    STATE_PENDING = "pending"
+    STATE_RUNNING = "running"
+    STATE_DONE = "done"
+    STATE_FAILED = "failed"
+    STATE_CHOICES = [
+        (STATE_PENDING, "Pending"),
+        (STATE_RUNNING, "Running"),
+        (STATE_DONE, "Done"),
+        (STATE_FAILED, "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    state = models.CharField(
+        max_length=10, choices=STATE_CHOICES, default=STATE_PENDING
+    )
+    file_name = models.CharField(max_length=255, verbose_name="Fichier")
+    file_path = models.CharField(max_length=500, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    class Meta:
+        verbose_name = "Import Excel"
+        verbose_name_plural = "Imports Excel"
+
+    def __str__(self):
+        return f"{self.file_name} ({self.state})"
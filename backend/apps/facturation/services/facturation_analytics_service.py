@@ -1,9 +1,22 @@
 import logging
 import traceback
 from decimal import Decimal
+from itertools import groupby
+from operator import itemgetter
 from typing import Dict, List, Optional, Any
-from django.db.models import Sum
-from ..models import Facturation, Avancement
+from django.core.cache import cache
+from django.db.models import (
+    CharField,
+    F,
+    FloatField,
+    QuerySet,
+    Sum,
+    Value,
+    Window,
+)
+from django.db.models.functions import Cast, TruncMonth
+from apps.core.constants import DECIMAL_PLACES
+from ..models import Facturation, Avancement, MonthlyEvolution
 
 logger = logging.getLogger(__name__)
 
@@ -18,19 +31,62 @@ class FacturationAnalyticsService:
     Key Features:
     - Calculates total facturation and avancement amounts
     - Generates monthly cumulative evolution data
-    - Direct database querying without caching
+    - Caches results per project until the next import or deletion
     """
 
-    def __init__(self, facturation_model=Facturation, avancement_model=Avancement):
+    # Cached results also expire when invalidate_cache() bumps
+    # CACHE_VERSION_KEY after an import or deletion
+    CACHE_TIMEOUT = 3600
+    CACHE_VERSION_KEY = "facturation:version"
+
+    # Rows fetched per round trip when streaming query results
+    ITERATOR_CHUNK_SIZE = 2000
+
+    # Name of the cumulative value in each evolution series
+    EVOLUTION_VALUE_KEYS = {
+        "facturation": "total_after_discount",
+        "avancement": "total_payment",
+    }
+
+    def __init__(
+        self,
+        facturation_model=Facturation,
+        avancement_model=Avancement,
+        monthly_evolution_model=MonthlyEvolution,
+    ):
         """
         Initialize the FacturationAnalyticsService.
 
         Args:
             facturation_model (Model, optional): Facturation model to use
             avancement_model (Model, optional): Avancement model to use
+            monthly_evolution_model (Model, optional): Precomputed evolution model
         """
         self.facturation_model = facturation_model
         self.avancement_model = avancement_model
+        self.monthly_evolution_model = monthly_evolution_model
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Expire every cached project result, after an import or deletion."""
+        try:
+            cache.incr(cls.CACHE_VERSION_KEY)
+        except ValueError:
+            cache.set(cls.CACHE_VERSION_KEY, 1, None)
+
+    def _get_cache_key(self, prefix: str, project_code: str) -> str:
+        """
+        Build a cache key under the current cache version.
+
+        Args:
+            prefix (str): Name of the cached result
+            project_code (str): Project code the result belongs to
+
+        Returns:
+            str: Cache key for the current state of the project data
+        """
+        version = cache.get_or_set(self.CACHE_VERSION_KEY, 1, None)
+        return f"facturation:{prefix}:{project_code}:{version}"
 
     def get_project_metrics(
         self, project_code: Optional[str] = None
@@ -50,8 +106,9 @@ class FacturationAnalyticsService:
                 "avancement_total": Decimal("0.00"),
             }
 
-        try:
-            # Parallel aggregation of facturation and avancement totals
+        def compute_metrics():
+            # Both aggregates run on the calling thread's connection, inside
+            # any transaction it has open
             facturation_query = self.facturation_model.objects.filter(
                 project_code=project_code
             ).aggregate(total=Sum("total_after_discount"))
@@ -65,124 +122,98 @@ class FacturationAnalyticsService:
                 "avancement_total": avancement_query["total"] or Decimal("0.00"),
             }
 
+        try:
+            return cache.get_or_set(
+                self._get_cache_key("metrics", project_code),
+                compute_metrics,
+                self.CACHE_TIMEOUT,
+            )
+
         except Exception as e:
+            # Re-raised rather than reported as zero totals
             logger.error(f"Error retrieving project metrics for {project_code}: {e}")
-            return {
-                "facturation_total": Decimal("0.00"),
-                "avancement_total": Decimal("0.00"),
-            }
+            raise
 
-    def _get_facturation_evolution(self, project_code: str) -> List[Dict]:
+    def _get_evolution_query(
+        self, model, project_code: str, date_field: str, amount_field: str, series: str
+    ) -> QuerySet:
         """
-        Calculate cumulative facturation evolution data grouped by month.
+        Build the monthly cumulative totals query for one evolution series.
 
         Args:
+            model (Model): Model to aggregate
             project_code (str): Project code to retrieve evolution data for
+            date_field (str): Date field used to group records by month
+            amount_field (str): Amount field to accumulate
+            series (str): Series name attached to every row
 
         Returns:
-            List[Dict]: List of monthly cumulative facturation totals
+            QuerySet: Tuples of (series, month, cumulative_total)
         """
-        try:
-            # Get all records for the project, ordered by date
-            records = self.facturation_model.objects.filter(
-                project_code=project_code
-            ).order_by("registration_date")
-
-            # Initialize variables for tracking
-            evolution_data = []
-            cumulative_total = Decimal("0.00")
-
-            # Group records by month
-            monthly_groups = {}
-            for record in records:
-                month_key = record.registration_date.replace(day=1)
-                if month_key not in monthly_groups:
-                    monthly_groups[month_key] = []
-                monthly_groups[month_key].append(record)
-
-            # Sort month keys
-            sorted_months = sorted(monthly_groups.keys())
-
-            # Calculate cumulative totals for each month
-            for month in sorted_months:
-                month_total = sum(
-                    record.total_after_discount for record in monthly_groups[month]
-                )
-                cumulative_total += month_total
-
-                evolution_data.append(
-                    {
-                        "date": month.isoformat(),
-                        "total_after_discount": float(cumulative_total),
-                    }
-                )
-
-            logger.info(
-                f"Facturation Evolution for {project_code}: {len(evolution_data)} records"
+        # Running totals per month, computed by a window function and cast to
+        # float in the database so no Decimal is built per row
+        return (
+            model.objects.filter(project_code=project_code)
+            .annotate(
+                series=Value(series, output_field=CharField()),
+                month=TruncMonth(date_field),
             )
-            return evolution_data
-
-        except Exception as e:
-            logger.error(
-                f"Error calculating facturation evolution for {project_code}: {e}"
+            .values("series", "month")
+            .distinct()
+            .annotate(
+                cumulative_total=Cast(
+                    Window(
+                        expression=Sum(amount_field),
+                        order_by=F("month").asc(),
+                    ),
+                    FloatField(),
+                )
             )
-            logger.error(traceback.format_exc())
-            return []
+            .values_list("series", "month", "cumulative_total")
+        )
 
-    def _get_avancement_evolution(self, project_code: str) -> List[Dict]:
+    def _get_monthly_totals(self, project_code: str) -> QuerySet:
         """
-        Calculate cumulative avancement evolution data grouped by month.
+        Build the query returning both evolution series for a project.
+
+        Reads the precomputed materialized view when the database supports
+        it, and otherwise aggregates the records directly.
 
         Args:
             project_code (str): Project code to retrieve evolution data for
 
         Returns:
-            List[Dict]: List of monthly cumulative avancement totals
+            QuerySet: Tuples of (series, month, cumulative_total)
         """
-        try:
-            # Get all records for the project, ordered by date
-            records = self.avancement_model.objects.filter(
-                project_code=project_code
-            ).order_by("accounting_date")
-
-            # Initialize variables for tracking
-            evolution_data = []
-            cumulative_total = Decimal("0.00")
-
-            # Group records by month
-            monthly_groups = {}
-            for record in records:
-                month_key = record.accounting_date.replace(day=1)
-                if month_key not in monthly_groups:
-                    monthly_groups[month_key] = []
-                monthly_groups[month_key].append(record)
-
-            # Sort month keys
-            sorted_months = sorted(monthly_groups.keys())
-
-            # Calculate cumulative totals for each month
-            for month in sorted_months:
-                month_total = sum(record.payment_ht for record in monthly_groups[month])
-                cumulative_total += month_total
-
-                evolution_data.append(
-                    {
-                        "date": month.isoformat(),
-                        "total_payment": float(cumulative_total),
-                    }
-                )
-
-            logger.info(
-                f"Avancement Evolution for {project_code}: {len(evolution_data)} records"
+        if self.monthly_evolution_model.is_available():
+            return (
+                self.monthly_evolution_model.objects.filter(project_code=project_code)
+                .annotate(cumulative_total=Cast("cumulative", FloatField()))
+                .order_by("series", "month")
+                .values_list("series", "month", "cumulative_total")
             )
-            return evolution_data
 
-        except Exception as e:
-            logger.error(
-                f"Error calculating avancement evolution for {project_code}: {e}"
+        # Both series are fetched in a single UNION ALL round trip
+        return (
+            self._get_evolution_query(
+                self.facturation_model,
+                project_code,
+                "registration_date",
+                "total_after_discount",
+                "facturation",
             )
-            logger.error(traceback.format_exc())
-            return []
+            .union(
+                self._get_evolution_query(
+                    self.avancement_model,
+                    project_code,
+                    "accounting_date",
+                    "payment_ht",
+                    "avancement",
+                ),
+                all=True,
+            )
+            .order_by("series", "month")
+        )
 
     def get_evolution_data(self, project_code: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -197,12 +228,38 @@ class FacturationAnalyticsService:
         if not project_code:
             return {"facturation": [], "avancement": []}
 
+        def compute_evolution():
+            monthly_totals = self._get_monthly_totals(project_code)
+
+            # Stream plain tuples rather than caching a list of dicts; rows
+            # arrive sorted by series, so each series is one contiguous group
+            evolution_data = {"facturation": [], "avancement": []}
+            rows = monthly_totals.iterator(chunk_size=self.ITERATOR_CHUNK_SIZE)
+            for series, series_rows in groupby(rows, key=itemgetter(0)):
+                value_key = self.EVOLUTION_VALUE_KEYS[series]
+                evolution_data[series] = [
+                    {
+                        "date": month.isoformat(),
+                        value_key: round(cumulative_total or 0.0, DECIMAL_PLACES),
+                    }
+                    for _, month, cumulative_total in series_rows
+                ]
+
+            logger.info(
+                f"Evolution for {project_code}: "
+                f"{len(evolution_data['facturation'])} facturation records, "
+                f"{len(evolution_data['avancement'])} avancement records"
+            )
+            return evolution_data
+
         try:
-            return {
-                "facturation": self._get_facturation_evolution(project_code),
-                "avancement": self._get_avancement_evolution(project_code),
-            }
+            return cache.get_or_set(
+                self._get_cache_key("evolution", project_code),
+                compute_evolution,
+                self.CACHE_TIMEOUT,
+            )
 
         except Exception as e:
             logger.error(f"Error retrieving evolution data for {project_code}: {e}")
+            logger.error(traceback.format_exc())
             return {"facturation": [], "avancement": []}
@@ -1,22 +1,45 @@
+import csv
+import hashlib
+import io
 import logging
+import os
+import shutil
+import stat
+import tempfile
+import time
+import numpy as np
 import pandas as pd
-from decimal import Decimal
-from typing import Dict, List
-from django.db import transaction
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, InvalidOperation
+from itertools import compress, islice
+from typing import Dict, Iterator, List, Optional
+from django.conf import settings
+from django.db import connection, transaction
 from django.db.models import Sum
+from django.utils import timezone
 from apps.core.services.base_service import BaseService
 from apps.core.services.excel_service import ExcelService
 from apps.core.exceptions import ValidationError
-from ..models import Facturation, Avancement
+from ..models import Facturation, Avancement, MonthlyEvolution
+from .facturation_analytics_service import FacturationAnalyticsService
 
 logger = logging.getLogger(__name__)
 
+# Stored for blank text cells, so every column and dtype agrees
+MISSING_TEXT = ""
+
+# NULL marker for COPY, so empty strings are still loaded as ''
+COPY_NULL = "\\N"
+
 
 class FacturationImportService(BaseService):
     """Service for handling Facturation and Avancement data import operations"""
 
     BATCH_SIZE = 5000
 
+    # How long parsed sheets are kept on disk for a re-import of the same file
+    SHEET_CACHE_TIMEOUT = 3600
+
     # Explicit column mappings
     FACTURATION_COLUMNS = {
         "document_number": "Numéro de document",
@@ -48,6 +71,14 @@ class FacturationImportService(BaseService):
         "accompte_flag": "Accompte_Flag",
     }
 
+    # Field order of the parsed row tuples
+    FACTURATION_FIELDS = tuple(FACTURATION_COLUMNS)
+    AVANCEMENT_FIELDS = tuple(AVANCEMENT_COLUMNS)
+
+    # Parsed fields a row cannot be imported without
+    FACTURATION_REQUIRED = ("quantity", "price", "line_total", "total_after_discount")
+    AVANCEMENT_REQUIRED = ("payment_ht", "payment_ttc")
+
     def __init__(self):
         super().__init__(Facturation)
         self.excel_service = ExcelService()
@@ -63,153 +94,386 @@ class FacturationImportService(BaseService):
                 f"Missing required columns in {sheet_name} sheet: {', '.join(missing_columns)}"
             )
 
-    def _parse_facturation_batch(self, df: pd.DataFrame) -> List[Facturation]:
-        """Parse a batch of Facturation records with enhanced validation."""
+    @staticmethod
+    def _text_values(series: pd.Series) -> List[str]:
+        """
+        Stringify and strip a column, like str(value).strip() on each cell.
+
+        Missing cells become MISSING_TEXT whatever the column's dtype.
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Convert each category once and look cells up by code; the
+            # trailing entry is picked by the -1 code of missing cells
+            labels = series.cat.categories.astype(str).str.strip().tolist()
+            return np.array(labels + [MISSING_TEXT], dtype=object)[
+                series.cat.codes.to_numpy()
+            ].tolist()
+        return (
+            series.astype(str).str.strip().where(series.notna(), MISSING_TEXT).tolist()
+        )
+
+    @staticmethod
+    def _flag_values(series: pd.Series) -> List[str]:
+        """First character of a one-letter flag column, MISSING_TEXT if blank."""
+        return series.astype(str).str[:1].where(series.notna(), MISSING_TEXT).tolist()
+
+    @staticmethod
+    def _date_values(series: pd.Series) -> List:
+        """Convert a column to dates, with None for missing values."""
+        dates = pd.to_datetime(series)
+        return [None if pd.isna(value) else value for value in dates.dt.date.tolist()]
+
+    @staticmethod
+    def _quantity_values(series: pd.Series) -> List[Optional[int]]:
+        """Truncate a quantity column to ints, with None for missing values."""
+        values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=float)
+        valid = np.isfinite(values)
+        quantities = np.full(len(values), None, dtype=object)
+        quantities[valid] = values[valid].astype(np.int64)
+        return quantities.tolist()
+
+    @staticmethod
+    def _to_decimal(value: str) -> Optional[Decimal]:
+        """Parse a Decimal, returning None when the value is not a number."""
         try:
-            self._validate_columns(df, self.FACTURATION_COLUMNS, "Facturation")
-            records = []
+            return Decimal(value)
+        except InvalidOperation:
+            return None
 
-            for index, row in df.iterrows():
-                try:
-                    record = Facturation(
-                        document_number=str(
-                            row[self.FACTURATION_COLUMNS["document_number"]]
-                        ).strip(),
-                        registration_date=(
-                            pd.to_datetime(
-                                row[self.FACTURATION_COLUMNS["registration_date"]]
-                            ).date()
-                            if pd.notna(
-                                row[self.FACTURATION_COLUMNS["registration_date"]]
-                            )
-                            else None
-                        ),
-                        document_status=str(
-                            row[self.FACTURATION_COLUMNS["document_status"]]
-                        ).strip(),
-                        client_code=str(
-                            row[self.FACTURATION_COLUMNS["client_code"]]
-                        ).strip(),
-                        client_name=str(
-                            row[self.FACTURATION_COLUMNS["client_name"]]
-                        ).strip(),
-                        item_code=str(
-                            row[self.FACTURATION_COLUMNS["item_code"]]
-                        ).strip(),
-                        description=str(
-                            row[self.FACTURATION_COLUMNS["description"]]
-                        ).strip(),
-                        quantity=int(
-                            float(row[self.FACTURATION_COLUMNS["quantity"]] or 0)
-                        ),
-                        price=Decimal(str(row[self.FACTURATION_COLUMNS["price"]] or 0)),
-                        line_total=Decimal(
-                            str(row[self.FACTURATION_COLUMNS["line_total"]] or 0)
-                        ),
-                        total_after_discount=Decimal(
-                            str(
-                                row[self.FACTURATION_COLUMNS["total_after_discount"]]
-                                or 0
-                            )
-                        ),
-                        project_code=str(
-                            row[self.FACTURATION_COLUMNS["project_code"]]
-                        ).strip(),
-                    )
-                    records.append(record)
-                except Exception as row_error:
-                    logger.warning(
-                        f"Error processing Facturation row {index}: {str(row_error)}"
-                    )
-                    continue
-            return records
+    @classmethod
+    def _amount_values(cls, series: pd.Series) -> List[Optional[Decimal]]:
+        """
+        Convert an amount column to Decimals; missing amounts are 0.
+
+        Unparseable cells become None so that only their row gets skipped.
+        Decimals are built from each float's shortest repr rather than with
+        Decimal.from_float, so 0.165 stays 0.165 (and rounds to 0.16 when
+        saved, as before) instead of the binary 0.16500000000000000777...
+        """
+        # str() over the Python floats from tolist() is cheaper than astype(str)
+        values = list(map(str, series.fillna(0).tolist()))
+        try:
+            return list(map(Decimal, values))
+        except InvalidOperation:
+            return [cls._to_decimal(value) for value in values]
+
+    def _batches(
+        self,
+        sheet_name: str,
+        index: pd.Index,
+        values: Dict[str, List],
+        fields: tuple,
+        required: tuple,
+    ) -> Iterator[List[tuple]]:
+        """
+        Assemble row tuples (ordered as fields) from parsed column values, in
+        batches of BATCH_SIZE.
+
+        Rows whose required quantity or amount could not be parsed (None) are
+        dropped with a single vectorized mask and reported in one warning.
+        """
+        valid = np.ones(len(index), dtype=bool)
+        for field in required:
+            valid &= ~pd.isna(np.asarray(values[field], dtype=object))
+
+        if not valid.all():
+            skipped = index[~valid]
+            logger.warning(
+                f"Skipped {len(skipped)} invalid {sheet_name} rows "
+                f"(rows {', '.join(map(str, skipped[:10]))}"
+                f"{', ...' if len(skipped) > 10 else ''})"
+            )
+
+        rows = compress(zip(*(values[field] for field in fields)), valid.tolist())
+        while True:
+            records = list(islice(rows, self.BATCH_SIZE))
+            if not records:
+                return
+            yield records
+
+    def _parse_facturation_sheet(self, df: pd.DataFrame) -> Iterator[List[tuple]]:
+        """
+        Parse the Facturation sheet into batches of BATCH_SIZE row tuples.
+
+        Each column is converted once for the whole sheet; batches are then
+        assembled from the column lists without slicing the DataFrame.
+        """
+        try:
+            cols = self.FACTURATION_COLUMNS
+            values = {
+                "document_number": self._text_values(df[cols["document_number"]]),
+                "registration_date": self._date_values(df[cols["registration_date"]]),
+                "document_status": self._text_values(df[cols["document_status"]]),
+                "client_code": self._text_values(df[cols["client_code"]]),
+                "client_name": self._text_values(df[cols["client_name"]]),
+                "item_code": self._text_values(df[cols["item_code"]]),
+                "description": self._text_values(df[cols["description"]]),
+                "quantity": self._quantity_values(df[cols["quantity"]]),
+                "price": self._amount_values(df[cols["price"]]),
+                "line_total": self._amount_values(df[cols["line_total"]]),
+                "total_after_discount": self._amount_values(
+                    df[cols["total_after_discount"]]
+                ),
+                "project_code": self._text_values(df[cols["project_code"]]),
+            }
+            yield from self._batches(
+                "Facturation",
+                df.index,
+                values,
+                self.FACTURATION_FIELDS,
+                self.FACTURATION_REQUIRED,
+            )
         except Exception as e:
-            logger.error(f"Error parsing Facturation batch: {str(e)}")
-            raise ValidationError(f"Failed to parse Facturation batch: {str(e)}")
+            logger.error(f"Error parsing Facturation sheet: {str(e)}")
+            raise ValidationError(f"Failed to parse Facturation sheet: {str(e)}")
 
-    def _parse_avancement_batch(self, df: pd.DataFrame) -> List[Avancement]:
-        """Parse a batch of Avancement records with enhanced validation."""
+    def _parse_avancement_sheet(self, df: pd.DataFrame) -> Iterator[List[tuple]]:
+        """
+        Parse the Avancement sheet into batches of BATCH_SIZE row tuples.
+
+        Each column is converted once for the whole sheet; batches are then
+        assembled from the column lists without slicing the DataFrame.
+        """
         try:
-            self._validate_columns(df, self.AVANCEMENT_COLUMNS, "Avancement")
-            records = []
+            cols = self.AVANCEMENT_COLUMNS
+            values = {
+                "doc_type": self._text_values(df[cols["doc_type"]]),
+                "doc_num": self._text_values(df[cols["doc_num"]]),
+                "accounting_date": self._date_values(df[cols["accounting_date"]]),
+                "payment_ht": self._amount_values(df[cols["payment_ht"]]),
+                "payment_ttc": self._amount_values(df[cols["payment_ttc"]]),
+                "payment_method": self._text_values(df[cols["payment_method"]]),
+                "project_code": self._text_values(df[cols["project_code"]]),
+                "num": self._text_values(df[cols["num"]]),  # Separate column
+                "total": self._text_values(df[cols["total"]]),  # Separate column
+                "dat": self._date_values(df[cols["dat"]]),
+                "canceled": self._flag_values(df[cols["canceled"]]),
+                "accompte_flag": self._flag_values(df[cols["accompte_flag"]]),
+            }
+            yield from self._batches(
+                "Avancement",
+                df.index,
+                values,
+                self.AVANCEMENT_FIELDS,
+                self.AVANCEMENT_REQUIRED,
+            )
+        except Exception as e:
+            logger.error(f"Error parsing Avancement sheet: {str(e)}")
+            raise ValidationError(f"Failed to parse Avancement sheet: {str(e)}")
 
-            for index, row in df.iterrows():
-                try:
-                    record = Avancement(
-                        doc_type=str(row[self.AVANCEMENT_COLUMNS["doc_type"]]).strip(),
-                        doc_num=str(row[self.AVANCEMENT_COLUMNS["doc_num"]]).strip(),
-                        accounting_date=(
-                            pd.to_datetime(
-                                row[self.AVANCEMENT_COLUMNS["accounting_date"]]
-                            ).date()
-                            if pd.notna(row[self.AVANCEMENT_COLUMNS["accounting_date"]])
-                            else None
-                        ),
-                        payment_ht=Decimal(
-                            str(row[self.AVANCEMENT_COLUMNS["payment_ht"]] or 0)
-                        ),
-                        payment_ttc=Decimal(
-                            str(row[self.AVANCEMENT_COLUMNS["payment_ttc"]] or 0)
-                        ),
-                        payment_method=str(
-                            row[self.AVANCEMENT_COLUMNS["payment_method"]]
-                        ).strip(),
-                        project_code=str(
-                            row[self.AVANCEMENT_COLUMNS["project_code"]]
-                        ).strip(),
-                        num=str(
-                            row[self.AVANCEMENT_COLUMNS["num"]]
-                        ).strip(),  # Separate column
-                        total=str(
-                            row[self.AVANCEMENT_COLUMNS["total"]]
-                        ).strip(),  # Separate column
-                        dat=(
-                            pd.to_datetime(row[self.AVANCEMENT_COLUMNS["dat"]]).date()
-                            if pd.notna(row[self.AVANCEMENT_COLUMNS["dat"]])
-                            else None
-                        ),
-                        canceled=str(row[self.AVANCEMENT_COLUMNS["canceled"]])[:1],
-                        accompte_flag=str(
-                            row[self.AVANCEMENT_COLUMNS["accompte_flag"]]
-                        )[:1],
-                    )
-                    records.append(record)
-                except Exception as row_error:
-                    logger.warning(
-                        f"Error processing Avancement row {index}: {str(row_error)}"
+    @staticmethod
+    def _copy_buffer(fields: List, names: tuple, records: List[tuple]) -> io.StringIO:
+        """Serialize parsed row tuples (ordered as names) for COPY."""
+        now = timezone.now()
+        positions = {name: position for position, name in enumerate(names)}
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        for record in records:
+            row = []
+            for field in fields:
+                if getattr(field, "auto_now", False) or getattr(
+                    field, "auto_now_add", False
+                ):
+                    value = now
+                else:
+                    position = positions.get(field.name)
+                    value = field.get_db_prep_save(
+                        None if position is None else record[position], connection
                     )
-                    continue
-            return records
+                row.append(COPY_NULL if value is None else value)
+            writer.writerow(row)
+
+        buffer.seek(0)
+        return buffer
+
+    def _bulk_insert(self, model, names: tuple, records: List[tuple]) -> None:
+        """
+        Insert a batch of parsed row tuples, whose values are ordered as names.
+
+        PostgreSQL streams them straight into a single COPY FROM STDIN without
+        building model instances; other databases fall back to bulk_create.
+
+        The tables have no unique constraint besides the generated id, so
+        there are no conflicts to handle: re-importing a file appends its rows
+        again, which is why the admin cleans a project's data first.
+        """
+        if connection.vendor != "postgresql":
+            model.objects.bulk_create(
+                [model(**dict(zip(names, record))) for record in records],
+                batch_size=settings.IMPORT_BULK_BATCH_SIZE,
+            )
+            return
+
+        fields = [f for f in model._meta.concrete_fields if not f.primary_key]
+        columns = ", ".join(connection.ops.quote_name(f.column) for f in fields)
+        sql = (
+            f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) "
+            f"FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+        )
+
+        with connection.cursor() as cursor:
+            cursor.copy_expert(sql, self._copy_buffer(fields, names, records))
+
+    @staticmethod
+    def _file_digest(excel_file) -> str:
+        """Return the SHA-256 of the file's content, leaving it rewound."""
+        digest = hashlib.sha256()
+        excel_file.seek(0)
+        for chunk in iter(lambda: excel_file.read(1024 * 1024), b""):
+            digest.update(chunk)
+        excel_file.seek(0)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _sheet_cache_dir() -> Optional[str]:
+        """
+        Return the private IMPORT_SCRATCH_DIR, creating it owner-only.
+
+        Returns None, so nothing is cached, when the directory exists but is
+        not a directory owned by this user with owner-only permissions.
+        """
+        path = os.fspath(settings.IMPORT_SCRATCH_DIR)
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        info = os.lstat(path)
+        if (
+            not stat.S_ISDIR(info.st_mode)
+            or info.st_uid != os.getuid()
+            or info.st_mode & 0o077
+        ):
+            logger.warning(
+                f"Not caching parsed sheets: {path} must be a directory owned "
+                "by this user with mode 0700"
+            )
+            return None
+        return path
+
+    def _purge_sheet_cache(self, cache_dir: str) -> None:
+        """Delete scratch entries older than SHEET_CACHE_TIMEOUT."""
+        cutoff = time.time() - self.SHEET_CACHE_TIMEOUT
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                        if entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                        else:
+                            os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+    @staticmethod
+    def _load_sheet_cache(path: str) -> Dict[str, pd.DataFrame]:
+        """Read the Feather files of a cached workbook, memory-mapped."""
+        from pyarrow import feather
+
+        sheets = {}
+        for name in sorted(os.listdir(path), key=lambda n: int(n.split(".")[0])):
+            table = feather.read_table(os.path.join(path, name), memory_map=True)
+            sheet_name = table.schema.metadata[b"sheet_name"].decode()
+            sheets[sheet_name] = table.to_pandas()
+        return sheets
+
+    @staticmethod
+    def _write_sheet_cache(sheets: Dict[str, pd.DataFrame], path: str) -> None:
+        """Write each sheet as a Feather file, keeping its name in the schema."""
+        import pyarrow as pa
+        from pyarrow import feather
+
+        for index, (sheet_name, df) in enumerate(sheets.items()):
+            table = pa.Table.from_pandas(df)
+            table = table.replace_schema_metadata(
+                {**table.schema.metadata, b"sheet_name": sheet_name.encode()}
+            )
+            feather.write_feather(
+                table, os.path.join(path, f"{index}.feather"), compression="zstd"
+            )
+
+    def _read_sheets(self, excel_file) -> Dict[str, pd.DataFrame]:
+        """
+        Read and clean the workbook's sheets.
+
+        The cleaned DataFrames are written as Feather files to a directory in
+        IMPORT_SCRATCH_DIR named after the file's content hash, so retrying
+        or re-running an import of the same file within SHEET_CACHE_TIMEOUT
+        memory-maps them instead of parsing the XLSX again.
+        """
+        cache_dir = self._sheet_cache_dir()
+        if cache_dir is None:
+            return self.excel_service.process_multi_sheet_excel(excel_file)
+        self._purge_sheet_cache(cache_dir)
+
+        path = os.path.join(cache_dir, self._file_digest(excel_file))
+        if os.path.isdir(path):
+            try:
+                sheets = self._load_sheet_cache(path)
+                logger.info("Reusing parsed sheets from a previous import of this file")
+                return sheets
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable sheet cache {path}: {str(e)}")
+
+        sheets = self.excel_service.process_multi_sheet_excel(excel_file)
+
+        # Write into a temporary directory renamed into place, so a
+        # concurrent import never reads a partial cache
+        tmp_path = tempfile.mkdtemp(dir=cache_dir, suffix=".tmp")
+        try:
+            self._write_sheet_cache(sheets, tmp_path)
+            shutil.rmtree(path, ignore_errors=True)
+            os.rename(tmp_path, path)
         except Exception as e:
-            logger.error(f"Error parsing Avancement batch: {str(e)}")
-            raise ValidationError(f"Failed to parse Avancement batch: {str(e)}")
+            logger.warning(f"Could not write sheet cache {path}: {str(e)}")
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        return sheets
 
     def process_excel_import(self, excel_file) -> Dict[str, int]:
         """Process Excel file with batch processing and enhanced validation."""
         try:
             logger.info("Starting Excel import process")
-            sheets = self.excel_service.process_multi_sheet_excel(excel_file)
+            sheets = self._read_sheets(excel_file)
 
-            with transaction.atomic():
-                facturation_count = 0
-                avancement_count = 0
-
-                for sheet_name, df in sheets.items():
-                    if sheet_name == "Facturation":
-                        for start in range(0, len(df), self.BATCH_SIZE):
-                            batch = df.iloc[start : start + self.BATCH_SIZE]
-                            records = self._parse_facturation_batch(batch)
-                            if records:
-                                Facturation.objects.bulk_create(records)
-                                facturation_count += len(records)
-
-                    elif sheet_name == "Avancement":
-                        for start in range(0, len(df), self.BATCH_SIZE):
-                            batch = df.iloc[start : start + self.BATCH_SIZE]
-                            records = self._parse_avancement_batch(batch)
-                            if records:
-                                Avancement.objects.bulk_create(records)
-                                avancement_count += len(records)
+            # Check both sheets up front, before anything is parsed or written
+            if "Facturation" in sheets:
+                self._validate_columns(
+                    sheets["Facturation"], self.FACTURATION_COLUMNS, "Facturation"
+                )
+            if "Avancement" in sheets:
+                self._validate_columns(
+                    sheets["Avancement"], self.AVANCEMENT_COLUMNS, "Avancement"
+                )
+
+            facturation_count = 0
+            avancement_count = 0
+
+            # Avancement is parsed on a worker thread while the Facturation
+            # batches are written; all database work stays on this thread,
+            # in a single transaction.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                avancement_batches = None
+                if "Avancement" in sheets:
+                    avancement_batches = executor.submit(
+                        list, self._parse_avancement_sheet(sheets["Avancement"])
+                    )
+
+                with transaction.atomic():
+                    if "Facturation" in sheets:
+                        for records in self._parse_facturation_sheet(
+                            sheets["Facturation"]
+                        ):
+                            self._bulk_insert(
+                                Facturation, self.FACTURATION_FIELDS, records
+                            )
+                            facturation_count += len(records)
+
+                    if avancement_batches is not None:
+                        for records in avancement_batches.result():
+                            self._bulk_insert(
+                                Avancement, self.AVANCEMENT_FIELDS, records
+                            )
+                            avancement_count += len(records)
+
+                    MonthlyEvolution.refresh()
+                    transaction.on_commit(FacturationAnalyticsService.invalidate_cache)
 
             return {
                 "facturation_count": facturation_count,
@@ -221,23 +485,40 @@ class FacturationImportService(BaseService):
             raise ValidationError(f"Failed to process Excel file: {str(e)}")
 
     def clean_import_data(self, project_code: str = None):
-        """Clean import data with batched deletion."""
+        """
+        Clean import data.
+
+        Nothing references these tables, so rows are deleted in one statement
+        per table without going through Django's deletion collector.
+        """
         try:
             with transaction.atomic():
                 if project_code:
-                    Facturation.objects.filter(project_code=project_code).delete()
-                    Avancement.objects.filter(project_code=project_code).delete()
+                    for model in (Facturation, Avancement):
+                        model.objects.filter(project_code=project_code)._raw_delete(
+                            connection.alias
+                        )
                     logger.info(f"Cleaned import data for project {project_code}")
                 else:
-                    self._batch_delete(Facturation)
-                    self._batch_delete(Avancement)
+                    self._truncate(Facturation, Avancement)
                     logger.info("Cleaned all import data")
+
+                MonthlyEvolution.refresh()
+                transaction.on_commit(FacturationAnalyticsService.invalidate_cache)
         except Exception as e:
             logger.error(f"Error cleaning import data: {str(e)}")
             raise ValidationError(f"Failed to clean import data: {str(e)}")
 
-    def _batch_delete(self, model, batch_size=1000):
-        """Delete records in batches to prevent memory issues."""
-        while model.objects.exists():
-            ids = model.objects.values_list("id", flat=True)[:batch_size]
-            model.objects.filter(id__in=list(ids)).delete()
+    @staticmethod
+    def _truncate(*models) -> None:
+        """Empty the tables with a single TRUNCATE (a plain DELETE off PostgreSQL)."""
+        if connection.vendor != "postgresql":
+            for model in models:
+                model.objects.all()._raw_delete(connection.alias)
+            return
+
+        tables = ", ".join(
+            connection.ops.quote_name(model._meta.db_table) for model in models
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE TABLE {tables} RESTART IDENTITY")
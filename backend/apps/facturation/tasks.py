@@ -0,0 +1,177 @@
+# Path: backend/apps/facturation/tasks.py
+
+import logging
+import os
+import tempfile
+import threading
+from datetime import timedelta
+from typing import Dict, Optional
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.utils import timezone
+
+from .models import ImportJob
+from .services.facturation_import_service import FacturationImportService
+
+logger = logging.getLogger(__name__)
+
+# A running import refreshes its updated_at every HEARTBEAT_INTERVAL; one not
+# refreshed for STALE_AFTER is taken to have died with its worker (restart,
+# recycling) and is marked as failed by the fail_stale_imports command
+HEARTBEAT_INTERVAL = timedelta(minutes=1)
+STALE_AFTER = timedelta(minutes=10)
+
+ACTIVE_STATES = [ImportJob.STATE_PENDING, ImportJob.STATE_RUNNING]
+
+
+def _update_job(job_id, from_states, **fields) -> bool:
+    """
+    Update a job only while it is in one of from_states.
+
+    Returns:
+        bool: Whether the job was updated
+    """
+    return bool(
+        ImportJob.objects.filter(pk=job_id, state__in=from_states).update(
+            updated_at=timezone.now(), **fields
+        )
+    )
+
+
+def _heartbeat(job_id, stop: threading.Event) -> None:
+    """Refresh a running job's updated_at until stop is set."""
+    try:
+        while not stop.wait(HEARTBEAT_INTERVAL.total_seconds()):
+            try:
+                _update_job(job_id, [ImportJob.STATE_RUNNING])
+            except Exception as e:
+                logger.warning(f"Heartbeat for import {job_id} failed: {str(e)}")
+    finally:
+        connections.close_all()
+
+
+def _remove_file(file_path: str) -> None:
+    if file_path:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
+
+
+def fail_stale_imports() -> int:
+    """
+    Mark imports whose worker stopped sending heartbeats as failed and remove
+    their saved uploads.
+
+    Run by the fail_stale_imports management command at startup.
+
+    Returns:
+        int: Number of imports marked as failed
+    """
+    stale = list(
+        ImportJob.objects.filter(
+            state__in=ACTIVE_STATES,
+            updated_at__lt=timezone.now() - STALE_AFTER,
+        ).values_list("pk", "file_path")
+    )
+    failed = 0
+    for job_id, file_path in stale:
+        if _update_job(
+            job_id,
+            ACTIVE_STATES,
+            state=ImportJob.STATE_FAILED,
+            error="Import interrupted before completion",
+            file_path="",
+        ):
+            _remove_file(file_path)
+            logger.warning(f"Background import {job_id} marked as failed (stale)")
+            failed += 1
+    return failed
+
+
+def get_import_status(task_id: str) -> Optional[Dict]:
+    """
+    Return the state of a background import.
+
+    Args:
+        task_id (str): Identifier returned by start_facturation_import
+
+    Returns:
+        Optional[Dict]: Status with a 'state' of pending, running, done or
+        failed, plus 'result' or 'error'; None if the task is unknown
+    """
+    try:
+        job = ImportJob.objects.get(pk=task_id)
+    except (ImportJob.DoesNotExist, ValidationError):
+        return None
+    return {"state": job.state, "result": job.result, "error": job.error}
+
+
+def run_facturation_import(task_id: str, file_path: str) -> None:
+    """
+    Import a saved Excel file and record the outcome on its ImportJob.
+
+    Args:
+        task_id (str): Identifier of the import
+        file_path (str): Path of the saved upload, removed once processed
+    """
+    if not _update_job(
+        task_id, [ImportJob.STATE_PENDING], state=ImportJob.STATE_RUNNING
+    ):
+        logger.warning(f"Background import {task_id} is no longer pending")
+        _remove_file(file_path)
+        connections.close_all()
+        return
+
+    stop = threading.Event()
+    heartbeat = threading.Thread(target=_heartbeat, args=(task_id, stop), daemon=True)
+    heartbeat.start()
+    try:
+        with open(file_path, "rb") as excel_file:
+            result = FacturationImportService().process_excel_import(excel_file)
+        outcome = {"state": ImportJob.STATE_DONE, "result": result}
+    except Exception as e:
+        logger.error(f"Background import {task_id} failed: {str(e)}")
+        outcome = {"state": ImportJob.STATE_FAILED, "error": str(e)}
+    finally:
+        stop.set()
+        heartbeat.join()
+        _remove_file(file_path)
+
+    try:
+        # Only a job still running is finished; one already failed as stale
+        # keeps that state
+        if not _update_job(task_id, [ImportJob.STATE_RUNNING], file_path="", **outcome):
+            logger.warning(f"Background import {task_id} was no longer running")
+    finally:
+        connections.close_all()
+
+
+def start_facturation_import(uploaded_file) -> str:
+    """
+    Save an uploaded Excel file and import it in a background thread.
+
+    The request returns as soon as the file is on disk, instead of holding
+    the web worker for the whole parse and insert. The job status is stored
+    in the database, so any worker can report it.
+
+    Args:
+        uploaded_file (UploadedFile): Excel file from the request
+
+    Returns:
+        str: Task identifier to poll with get_import_status
+    """
+    fd, file_path = tempfile.mkstemp(prefix="facturation_import_", suffix=".xlsx")
+    with os.fdopen(fd, "wb") as destination:
+        for chunk in uploaded_file.chunks():
+            destination.write(chunk)
+
+    job = ImportJob.objects.create(file_name=uploaded_file.name, file_path=file_path)
+    task_id = str(job.pk)
+    threading.Thread(
+        target=run_facturation_import, args=(task_id, file_path), daemon=True
+    ).start()
+
+    logger.info(f"Started background import {task_id} for {uploaded_file.name}")
+    return task_id
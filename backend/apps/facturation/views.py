@@ -1,14 +1,15 @@
 import logging
 from django.db.models import Sum
-from typing import Dict
+from typing import Dict, List
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser
 from drf_spectacular.utils import extend_schema, OpenApiParameter
+from django.db import models
 from django.db.models import QuerySet
 
-from .models import Facturation, Avancement
+from .models import Facturation, Avancement, MonthlyEvolution
 from .serializers.facturation_serializer import (
     FacturationSerializer,
     AvancementSerializer,
@@ -21,6 +22,10 @@ from .services.facturation_analytics_service import FacturationAnalyticsService
 # Configure logging for the module
 logger = logging.getLogger(__name__)
 
+# Rows per table and page for paginated get_tables requests
+TABLES_PAGE_SIZE = 1000
+TABLES_MAX_PAGE_SIZE = 5000
+
 
 class FacturationViewSet(viewsets.ModelViewSet):
     """
@@ -156,9 +161,9 @@ class FacturationViewSet(viewsets.ModelViewSet):
             # Retrieve project metrics
             metrics = self.analytics_service.get_project_metrics(project_code)
 
-            # Serialize and return metrics
-            serializer = FacturationMetricsSerializer(metrics)
-            return Response(serializer.data)
+            # The service already returns the documented shape, so skip the
+            # serializer round trip (it is only used for the API schema)
+            return Response(metrics)
 
         except Exception as e:
             # Log and handle any retrieval errors
@@ -212,9 +217,8 @@ class FacturationViewSet(viewsets.ModelViewSet):
             # Retrieve project evolution data
             evolution_data = self.analytics_service.get_evolution_data(project_code)
 
-            # Serialize and return evolution data
-            serializer = EvolutionDataSerializer(evolution_data)
-            return Response(serializer.data)
+            # Returned as is; EvolutionDataSerializer only documents the schema
+            return Response(evolution_data)
 
         except Exception as e:
             # Log and handle any retrieval errors
@@ -224,6 +228,26 @@ class FacturationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+    @staticmethod
+    def _table_rows(queryset: QuerySet, fields: List[str]) -> List[Dict]:
+        """
+        Fetch table rows as plain dicts.
+
+        Skips per-row serializer dispatch; decimals are formatted as strings,
+        the same as the model serializers output them.
+        """
+        decimal_fields = [
+            field.name
+            for field in queryset.model._meta.concrete_fields
+            if isinstance(field, models.DecimalField) and field.name in fields
+        ]
+        rows = list(queryset.values(*fields))
+        for row in rows:
+            for field in decimal_fields:
+                if row[field] is not None:
+                    row[field] = format(row[field], "f")
+        return rows
+
     @extend_schema(
         description="Retrieve detailed Facturation and Avancement tables for a project",
         parameters=[
@@ -233,6 +257,18 @@ class FacturationViewSet(viewsets.ModelViewSet):
                 required=True,
                 type=str,
             ),
+            OpenApiParameter(
+                name="page",
+                description="Page number; returns every row when omitted",
+                required=False,
+                type=int,
+            ),
+            OpenApiParameter(
+                name="page_size",
+                description=f"Rows per table and page (default {TABLES_PAGE_SIZE})",
+                required=False,
+                type=int,
+            ),
         ],
         responses={
             200: {"description": "Detailed tables retrieved successfully"},
@@ -249,12 +285,15 @@ class FacturationViewSet(viewsets.ModelViewSet):
         - Detailed Avancement records
         - Ordered by most recent date
 
+        With a page query parameter, both tables are sliced to that page and
+        the response also carries their total counts.
+
         Args:
             request (Request): HTTP request object
             project_code (str): Unique project identifier
 
         Returns:
-            Response: Serialized Facturation and Avancement tables
+            Response: Facturation and Avancement tables
 
         Raises:
             Exception: If table data retrieval fails
@@ -273,13 +312,37 @@ class FacturationViewSet(viewsets.ModelViewSet):
                 project_code=project_code
             ).order_by("-accounting_date")
 
-            # Return serialized tables data
+            page = request.query_params.get("page")
+            if page is None:
+                return Response(
+                    {
+                        "facturation": self._table_rows(
+                            facturation_data, FacturationSerializer.Meta.fields
+                        ),
+                        "avancement": self._table_rows(
+                            avancement_data, AvancementSerializer.Meta.fields
+                        ),
+                    }
+                )
+
+            page = max(int(page), 1)
+            page_size = int(request.query_params.get("page_size", TABLES_PAGE_SIZE))
+            page_size = min(max(page_size, 1), TABLES_MAX_PAGE_SIZE)
+            start = (page - 1) * page_size
+            end = start + page_size
+
             return Response(
                 {
-                    "facturation": FacturationSerializer(
-                        facturation_data, many=True
-                    ).data,
-                    "avancement": AvancementSerializer(avancement_data, many=True).data,
+                    "facturation": self._table_rows(
+                        facturation_data[start:end], FacturationSerializer.Meta.fields
+                    ),
+                    "avancement": self._table_rows(
+                        avancement_data[start:end], AvancementSerializer.Meta.fields
+                    ),
+                    "facturation_count": facturation_data.count(),
+                    "avancement_count": avancement_data.count(),
+                    "page": page,
+                    "page_size": page_size,
                 }
             )
 
@@ -342,6 +405,11 @@ class FacturationViewSet(viewsets.ModelViewSet):
                 project_code=project_code
             ).delete()
 
+            # Drop the project from the precomputed evolution data and the
+            # cached metrics
+            MonthlyEvolution.refresh()
+            FacturationAnalyticsService.invalidate_cache()
+
             # Prepare deletion summary
             deletion_summary = {
                 "facturation_count": facturation_deleted[0],
@@ -48,6 +48,10 @@ class ProjectMembershipInline(admin.TabularInline):
     extra = 1
     autocomplete_fields = ["project"]
 
+    def get_queryset(self, request):
+        # Each row renders its user and project; load them with the memberships
+        return super().get_queryset(request).select_related("project", "user")
+
 
 class CustomUserAdmin(BaseUserAdmin):
     """
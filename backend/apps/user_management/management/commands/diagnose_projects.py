@@ -15,15 +15,18 @@ class Command(BaseCommand):
         ).distinct()
 
         self.stdout.write(self.style.NOTICE("Diagnostic Information:"))
-        self.stdout.write(f"Total unique supplier codes: {len(unique_users)}")
+        self.stdout.write(f"Total unique supplier codes: {unique_users.count()}")
 
         # Print first few unique users
         self.stdout.write("\nSample Supplier Codes:")
-        for code in list(unique_users)[:10]:
-            self.stdout.write(code)
+        self.stdout.write("\n".join(unique_users.order_by("code_fournisseur")[:10]))
 
         # Check existing users
         self.stdout.write("\nExisting Users:")
-        existing_users = User.objects.all()
-        for user in existing_users:
-            self.stdout.write(f"Username: {user.username}, ID: {user.id}")
+        existing_users = User.objects.values_list("username", "id")
+        self.stdout.write(
+            "\n".join(
+                f"Username: {username}, ID: {user_id}"
+                for username, user_id in existing_users
+            )
+        )
@@ -1,68 +1,127 @@
 # In backend/apps/user_management/management/commands/sync_project_memberships.py
+from collections import defaultdict
+
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from apps.commandes.models import Commande
-from apps.user_management.models import Project, ProjectMembership
+from apps.user_management.models import Project, ProjectMembership, UserProfile
 from django.contrib.auth.models import User
 
 
 class Command(BaseCommand):
     help = "Synchronize project memberships based on Commande data"
 
+    BATCH_SIZE = 1000
+
     def handle(self, *args, **kwargs):
         # Get all projects
-        projects = Project.objects.all()
-
-        # Tracking metrics
-        total_memberships_created = 0
-        skipped_memberships = 0
-
-        # Iterate through projects
-        for project in projects:
-            # Get unique supplier codes for this project
-            unique_suppliers = (
-                Commande.objects.filter(code_projet=project.code)
-                .values_list("code_fournisseur", flat=True)
-                .distinct()
+        projects = dict(Project.objects.values_list("code", "id"))
+
+        # Unique supplier codes per project, in a single query
+        suppliers_by_project = defaultdict(list)
+        for project_code, supplier_code in (
+            Commande.objects.filter(code_projet__in=projects)
+            .values_list("code_projet", "code_fournisseur")
+            .order_by()  # Default ordering would defeat distinct()
+            .distinct()
+        ):
+            suppliers_by_project[project_code].append(supplier_code)
+
+        supplier_codes = {
+            supplier_code
+            for suppliers in suppliers_by_project.values()
+            for supplier_code in suppliers
+            if supplier_code
+        }
+
+        with transaction.atomic():
+            users = self._ensure_users(supplier_codes)
+
+            existing_memberships = set(
+                ProjectMembership.objects.filter(
+                    project_id__in=projects.values()
+                ).values_list("user_id", "project_id")
             )
 
-            self.stdout.write(f"\nProcessing Project: {project.code}")
-            self.stdout.write(f"Unique suppliers: {len(unique_suppliers)}")
+            # Tracking metrics
+            skipped_memberships = 0
+            new_memberships = []
+            messages = []
 
-            # Create memberships
-            for supplier_code in unique_suppliers:
-                if not supplier_code:
-                    skipped_memberships += 1
-                    continue
+            for project_code, project_id in projects.items():
+                unique_suppliers = suppliers_by_project.get(project_code, [])
 
-                # Try to find or create a user
-                user, created = User.objects.get_or_create(
-                    username=supplier_code,
-                    defaults={
-                        "first_name": f"Supplier {supplier_code}",
-                        "is_active": False,  # Mark as inactive by default
-                    },
-                )
+                messages.append(f"\nProcessing Project: {project_code}")
+                messages.append(f"Unique suppliers: {len(unique_suppliers)}")
 
-                # Create project membership
-                membership, created = ProjectMembership.objects.get_or_create(
-                    user=user,
-                    project=project,
-                    defaults={"role": "VIEWER"},  # Default role
-                )
+                for supplier_code in unique_suppliers:
+                    if not supplier_code:
+                        skipped_memberships += 1
+                        continue
 
-                if created:
-                    total_memberships_created += 1
-                    self.stdout.write(
+                    user_id = users[supplier_code]
+                    if (user_id, project_id) in existing_memberships:
+                        continue
+
+                    new_memberships.append(
+                        ProjectMembership(
+                            user_id=user_id,
+                            project_id=project_id,
+                            role="VIEWER",  # Default role
+                        )
+                    )
+                    messages.append(
                         self.style.SUCCESS(
-                            f"Created membership for {user.username} in project {project.code}"
+                            f"Created membership for {supplier_code} in project {project_code}"
                         )
                     )
 
+            ProjectMembership.objects.bulk_create(
+                new_memberships, batch_size=self.BATCH_SIZE
+            )
+
+        self.stdout.write("\n".join(messages))
+
         # Final report
         self.stdout.write(self.style.SUCCESS("\nSynchronization Summary:"))
-        self.stdout.write(
-            f"Total project memberships created: {total_memberships_created}"
-        )
+        self.stdout.write(f"Total project memberships created: {len(new_memberships)}")
         self.stdout.write(
             f"Skipped memberships (empty supplier code): {skipped_memberships}"
         )
+
+    def _ensure_users(self, supplier_codes):
+        """
+        Return a username -> id map for the supplier codes, bulk-creating the
+        missing (inactive) supplier users and their profiles.
+        """
+        users = dict(
+            User.objects.filter(username__in=supplier_codes).values_list(
+                "username", "id"
+            )
+        )
+        missing = supplier_codes - users.keys()
+        if not missing:
+            return users
+
+        # bulk_create skips post_save, so profiles are created here as well
+        User.objects.bulk_create(
+            [
+                User(
+                    username=supplier_code,
+                    first_name=f"Supplier {supplier_code}",
+                    is_active=False,  # Mark as inactive by default
+                )
+                for supplier_code in missing
+            ],
+            batch_size=self.BATCH_SIZE,
+        )
+        created = dict(
+            User.objects.filter(username__in=missing).values_list("username", "id")
+        )
+        UserProfile.objects.bulk_create(
+            [UserProfile(user_id=user_id) for user_id in created.values()],
+            batch_size=self.BATCH_SIZE,
+        )
+
+        users.update(created)
+        return users
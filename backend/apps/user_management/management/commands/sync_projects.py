@@ -2,6 +2,7 @@ from django.core.management.base import BaseCommand
 from apps.commandes.models import Commande
 from apps.user_management.models import Project
 from apps.core.constants import PROJECT_NAME_MAP
+from django.db import IntegrityError, transaction
 from django.db.models import Count
 
 
@@ -9,52 +10,80 @@ class Command(BaseCommand):
     help = "Synchronize projects from Commande model and project constants"
 
     def handle(self, *args, **kwargs):
-        # Get project codes with their total count
-        project_code_counts = (
-            Commande.objects.values("code_projet")
-            .annotate(total_count=Count("id"))
-            .order_by("-total_count")
-        )
+        if kwargs.get("verbosity", 1) >= 2:
+            # Get project codes with their total count
+            project_code_counts = (
+                Commande.objects.values_list("code_projet")
+                .annotate(total_count=Count("id"))
+                .order_by("-total_count")
+            )
 
-        self.stdout.write(self.style.NOTICE("Project Code Breakdown:"))
-        for project in project_code_counts:
-            code = project["code_projet"]
-            count = project["total_count"]
-            self.stdout.write(f"{code}: {count} commandes")
+            self.stdout.write(self.style.NOTICE("Project Code Breakdown:"))
+            self.stdout.write(
+                "\n".join(
+                    f"{code}: {count} commandes" for code, count in project_code_counts
+                )
+            )
+            project_codes = {code for code, _ in project_code_counts}
+        else:
+            # Only the codes are needed, so skip the per-code COUNT
+            project_codes = set(
+                Commande.objects.values_list("code_projet", flat=True)
+                .order_by()
+                .distinct()
+            )
 
         # Combine project codes from Commande and PROJECT_NAME_MAP
-        all_project_codes = set(
-            list(project["code_projet"] for project in project_code_counts)
-            + list(PROJECT_NAME_MAP.keys())
-        )
+        all_project_codes = project_codes | PROJECT_NAME_MAP.keys()
 
-        created_count = 0
-        existing_count = 0
+        existing_codes = set(
+            Project.objects.filter(code__in=all_project_codes).values_list(
+                "code", flat=True
+            )
+        )
 
+        # Prepare the missing projects (empty codes are skipped)
+        new_projects = []
         for code in all_project_codes:
-            if not code:  # Skip empty codes
+            if not code or code in existing_codes:
                 continue
 
-            # Prepare project details
             project_details = PROJECT_NAME_MAP.get(code, {})
-            project_name = project_details.get("name", code)
-            project_type = project_details.get("type", "FORFAIT")
-
-            # Create project if not exists
-            project, created = Project.objects.get_or_create(
-                code=code,
-                defaults={
-                    "name": project_name,
-                    "type": project_type,
-                    "description": f"Project synchronized for code {code}",
-                },
+            new_projects.append(
+                Project(
+                    code=code,
+                    name=project_details.get("name", code),
+                    type=project_details.get("type", "FORFAIT"),
+                    description=f"Project synchronized for code {code}",
+                )
             )
 
-            if created:
-                created_count += 1
-                self.stdout.write(self.style.SUCCESS(f"Created project: {code}"))
-            else:
-                existing_count += 1
+        # Single INSERT instead of a get_or_create per code
+        try:
+            with transaction.atomic():
+                Project.objects.bulk_create(new_projects, batch_size=500)
+            created_projects = new_projects
+        except IntegrityError:
+            # A concurrent run inserted some of these codes; the batch was
+            # rolled back, so create them one by one and report only our own
+            created_projects = [
+                project
+                for project in new_projects
+                if Project.objects.get_or_create(
+                    code=project.code,
+                    defaults={
+                        "name": project.name,
+                        "type": project.type,
+                        "description": project.description,
+                    },
+                )[1]
+            ]
+
+        for project in created_projects:
+            self.stdout.write(self.style.SUCCESS(f"Created project: {project.code}"))
+
+        created_count = len(created_projects)
+        existing_count = len(existing_codes)
 
         # Detailed reporting
         self.stdout.write(self.style.SUCCESS("\nSynchronization Summary:"))
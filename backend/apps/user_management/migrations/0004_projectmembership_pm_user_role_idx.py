@@ -0,0 +1,19 @@
+# Generated by Django 5.2.1 on 2026-10-15 23:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user_management", "0003_userprofile"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="projectmembership",
+            index=models.Index(fields=["user", "role"], name="pm_user_role_idx"),
+        ),
+    ]
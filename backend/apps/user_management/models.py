@@ -1,6 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from decimal import Decimal
 
@@ -38,23 +39,20 @@ class UserProfile(models.Model):
 
 
 @receiver(post_save, sender=User)
-def create_user_profile(sender, instance, created, **kwargs):
+def create_user_profile(sender, instance, created, raw=False, **kwargs):
     """
-    Automatically create a UserProfile when a new User is created
-    """
-    if created:
-        UserProfile.objects.create(user=instance)
-
+    Make sure every User has a UserProfile.
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """
-    Ensure UserProfile is saved when User is saved
+    Partial saves (e.g. the last_login update on each login) and fixture
+    loading are skipped, so they do not cost an extra profile query.
     """
-    try:
-        instance.profile.save()
-    except UserProfile.DoesNotExist:
+    if raw or kwargs.get("update_fields"):
+        return
+
+    if created:
         UserProfile.objects.create(user=instance)
+    else:
+        UserProfile.objects.get_or_create(user=instance)
 
 
 class Project(BaseModel):
@@ -113,8 +111,25 @@ class ProjectMembership(BaseModel):
 
     class Meta:
         unique_together = ("user", "project")
+        # unique_together already indexes (user, project); this one covers
+        # the per-user role breakdown in project_metrics
+        indexes = [models.Index(fields=["user", "role"], name="pm_user_role_idx")]
         verbose_name = "Project Membership"
         verbose_name_plural = "Project Memberships"
 
     def __str__(self):
         return f"{self.user.username} - {self.project.code} ({self.role})"
+
+
+def project_cache_key(code, variant="ensure"):
+    """
+    Cache key for the serialized project returned by the ensure-project endpoints
+    """
+    return f"project:{variant}:{code}"
+
+
+@receiver([post_save, post_delete], sender=Project)
+def invalidate_project_cache(sender, instance, **kwargs):
+    cache.delete_many(
+        [project_cache_key(instance.code), project_cache_key(instance.code, "full")]
+    )
@@ -1,6 +1,7 @@
 from .serializers import (
     ProjectEnsureSerializer,
     ProjectSerializer,
+    ProjectListSerializer,
     ProjectMembershipSerializer,
     UserProjectsSerializer,
 )
@@ -8,6 +9,7 @@ from .serializers import (
 __all__ = [
     "ProjectEnsureSerializer",
     "ProjectSerializer",
+    "ProjectListSerializer",
     "ProjectMembershipSerializer",
     "UserProjectsSerializer",
 ]
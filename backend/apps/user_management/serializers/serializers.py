@@ -23,6 +23,16 @@ class ProjectSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class ProjectListSerializer(serializers.ModelSerializer):
+    """
+    Lightweight Project Serializer for list views
+    """
+
+    class Meta:
+        model = Project
+        fields = ["id", "code", "name", "type", "is_active"]
+
+
 class ProjectMembershipSerializer(serializers.ModelSerializer):
     """
     Serializer for Project Membership
@@ -51,7 +61,8 @@ class UserProjectsSerializer(serializers.ModelSerializer):
         """
         Get all projects for a user
         """
-        project_memberships = obj.project_memberships.select_related("project")
+        # Prefetched by UserProjectViewSet, so no query per user
+        project_memberships = obj.project_memberships.all()
         return [
             {
                 "code": membership.project.code,
@@ -4,11 +4,15 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.contrib.auth.models import User
-from django.db.models import Count, Q
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Prefetch, Q
+from django.utils import timezone
 
-from .models import Project, ProjectMembership
+from .models import Project, ProjectMembership, project_cache_key
 from .serializers import (
     ProjectSerializer,
+    ProjectListSerializer,
     ProjectMembershipSerializer,
     UserProjectsSerializer,
     ProjectEnsureSerializer,
@@ -18,6 +22,41 @@ from apps.core.constants import PROJECT_NAME_MAP
 # Configure logging for the module
 logger = logging.getLogger(__name__)
 
+# Seconds an ensured project stays cached (entries are dropped on save/delete)
+ENSURE_PROJECT_CACHE_TIMEOUT = 300
+
+
+def ensure_project_data(project_code, serializer_class, variant="ensure"):
+    """
+    Return (serialized project, created), creating the project if needed.
+    Existing projects are served from the cache without a database query.
+    """
+    key = project_cache_key(project_code, variant)
+    data = cache.get(key)
+    if data is not None:
+        return data, False
+
+    # Plain lookup first: the defaults are only built for a missing project
+    project = Project.objects.filter(code=project_code).first()
+    created = project is None
+    if created:
+        project_details = PROJECT_NAME_MAP.get(project_code, {})
+        try:
+            with transaction.atomic():
+                project = Project.objects.create(
+                    code=project_code,
+                    name=project_details.get("name", project_code),
+                    type=project_details.get("type", "FORFAIT"),
+                    description=f"Project automatically created for {project_code}",
+                )
+        except IntegrityError:
+            # Created concurrently by another request
+            project = Project.objects.get(code=project_code)
+            created = False
+    data = serializer_class(project).data
+    cache.set(key, data, ENSURE_PROJECT_CACHE_TIMEOUT)
+    return data, created
+
 
 class EnsureProjectExistsView(APIView):
     """
@@ -27,24 +66,10 @@ class EnsureProjectExistsView(APIView):
     def get(self, request, project_code):
         try:
             # Try to get the project, create if not exists
-            project, created = Project.objects.get_or_create(
-                code=project_code,
-                defaults={
-                    "name": PROJECT_NAME_MAP.get(project_code, {}).get(
-                        "name", project_code
-                    ),
-                    "type": PROJECT_NAME_MAP.get(project_code, {}).get(
-                        "type", "FORFAIT"
-                    ),
-                    "description": f"Project automatically created for {project_code}",
-                },
-            )
-
-            # Serialize the project
-            serializer = ProjectEnsureSerializer(project)
+            data, created = ensure_project_data(project_code, ProjectEnsureSerializer)
 
             return Response(
-                {"project": serializer.data, "created": created},
+                {"project": data, "created": created},
                 status=status.HTTP_200_OK,
             )
 
@@ -65,8 +90,16 @@ class ProjectViewSet(viewsets.ModelViewSet):
     serializer_class = ProjectSerializer
     lookup_field = "code"
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return ProjectListSerializer
+        return super().get_serializer_class()
+
     def get_queryset(self):
         queryset = Project.objects.all()
+        if self.action == "list":
+            # Skip description and budget columns the list does not return
+            queryset = queryset.only(*ProjectListSerializer.Meta.fields)
         project_type = self.request.query_params.get("type")
         is_active = self.request.query_params.get("active")
 
@@ -79,8 +112,6 @@ class ProjectViewSet(viewsets.ModelViewSet):
         if is_active is not None:
             is_active = is_active.lower() in ["true", "1", "yes"]
             queryset = queryset.filter(is_active=is_active)
-
-        logger.debug(f"Filtered queryset count: {queryset.count()}")
         return queryset
 
     @action(detail=False, methods=["GET"])
@@ -97,23 +128,12 @@ class ProjectViewSet(viewsets.ModelViewSet):
             )
 
         try:
-            project, created = Project.objects.get_or_create(
-                code=project_code,
-                defaults={
-                    "name": PROJECT_NAME_MAP.get(project_code, {}).get(
-                        "name", project_code
-                    ),
-                    "type": PROJECT_NAME_MAP.get(project_code, {}).get(
-                        "type", "FORFAIT"
-                    ),
-                    "description": f"Project automatically created for {project_code}",
-                },
+            data, created = ensure_project_data(
+                project_code, self.get_serializer_class(), variant="full"
             )
 
-            serializer = self.get_serializer(project)
-
             return Response(
-                {"project": serializer.data, "created": created},
+                {"project": data, "created": created},
                 status=status.HTTP_200_OK,
             )
 
@@ -142,9 +162,13 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 user=user, project=project, defaults={"role": role}
             )
 
-            if not created:
+            if not created and membership.role != role:
+                # Targeted UPDATE of the changed columns only
                 membership.role = role
-                membership.save()
+                membership.updated_at = timezone.now()
+                ProjectMembership.objects.filter(pk=membership.pk).update(
+                    role=role, updated_at=membership.updated_at
+                )
 
             logger.info(f"User {user.username} added to project {project.code}")
 
@@ -160,6 +184,72 @@ class ProjectViewSet(viewsets.ModelViewSet):
             logger.error(f"Error adding member to project {code}: {str(e)}")
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=True, methods=["POST"])
+    def bulk_add_members(self, request, code=None):
+        """
+        Add several members to the project in one call.
+
+        Expects {"members": [{"user_id": ..., "role": ...}, ...]}. Unknown users
+        and existing memberships are skipped; existing roles are left unchanged.
+        """
+        logger.info(f"Bulk adding members to project {code}")
+        try:
+            project = self.get_object()
+            items = request.data.get("members", [])
+            if not isinstance(items, list):
+                return Response(
+                    {"error": "members must be a list"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            roles = dict(ProjectMembership.ROLE_CHOICES)
+            requested = {}
+            for item in items:
+                role = item.get("role", "MEMBER")
+                if role not in roles:
+                    return Response(
+                        {"error": f"Invalid role: {role}"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                requested[int(item["user_id"])] = role
+
+            valid_ids = set(
+                User.objects.filter(id__in=requested).values_list("id", flat=True)
+            )
+            existing_ids = set(
+                ProjectMembership.objects.filter(
+                    project=project, user_id__in=valid_ids
+                ).values_list("user_id", flat=True)
+            )
+
+            memberships = [
+                ProjectMembership(user_id=user_id, project=project, role=role)
+                for user_id, role in requested.items()
+                if user_id in valid_ids and user_id not in existing_ids
+            ]
+            ProjectMembership.objects.bulk_create(
+                memberships, batch_size=500, ignore_conflicts=True
+            )
+
+            logger.info(f"Added {len(memberships)} members to project {project.code}")
+            return Response(
+                {
+                    "created": len(memberships),
+                    "existing": len(existing_ids),
+                    "unknown_users": sorted(requested.keys() - valid_ids),
+                },
+                status=status.HTTP_201_CREATED,
+            )
+
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return Response(
+                {"error": "Each member needs a numeric user_id"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except Exception as e:
+            logger.error(f"Error bulk adding members to project {code}: {str(e)}")
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
     @action(detail=True, methods=["GET"])
     def members(self, request, code=None):
         """
@@ -169,9 +259,11 @@ class ProjectViewSet(viewsets.ModelViewSet):
         try:
             project = self.get_object()
             logger.info(f"Project found: {project}")
-            memberships = ProjectMembership.objects.filter(project=project)
-            logger.info(f"Number of memberships found: {memberships.count()}")
+            memberships = ProjectMembership.objects.filter(
+                project=project
+            ).select_related("user", "project")
             serializer = ProjectMembershipSerializer(memberships, many=True)
+            logger.info(f"Number of memberships found: {len(serializer.data)}")
             return Response(serializer.data)
         except Project.DoesNotExist:
             logger.error(f"Project with code {code} does not exist")
@@ -198,7 +290,22 @@ class UserProjectViewSet(viewsets.ReadOnlyModelViewSet):
             queryset = User.objects.all()
         else:
             queryset = User.objects.filter(id=user.id)
-        logger.debug(f"Queryset count: {queryset.count()}")
+
+        if self.action in ("list", "retrieve"):
+            # Load every listed user's memberships in one extra query;
+            # "user" stays loaded so the prefetch can match them back
+            queryset = queryset.prefetch_related(
+                Prefetch(
+                    "project_memberships",
+                    queryset=ProjectMembership.objects.select_related("project").only(
+                        "user",
+                        "role",
+                        "project__code",
+                        "project__name",
+                        "project__type",
+                    ),
+                )
+            )
         return queryset
 
     @action(detail=True, methods=["GET"])
@@ -211,21 +318,22 @@ class UserProjectViewSet(viewsets.ReadOnlyModelViewSet):
             user = self.get_object()
             project_memberships = ProjectMembership.objects.filter(user=user)
 
+            # Let the database group and count the memberships
+            roles_breakdown = dict(
+                project_memberships.values_list("role").annotate(count=Count("id"))
+            )
+            project_types = dict(
+                project_memberships.values_list("project__type").annotate(
+                    count=Count("id")
+                )
+            )
+
             metrics = {
-                "total_projects": project_memberships.count(),
-                "roles_breakdown": {},
-                "project_types": {},
+                "total_projects": sum(roles_breakdown.values()),
+                "roles_breakdown": roles_breakdown,
+                "project_types": project_types,
             }
 
-            for membership in project_memberships:
-                metrics["roles_breakdown"][membership.role] = (
-                    metrics["roles_breakdown"].get(membership.role, 0) + 1
-                )
-                project_type = membership.project.type
-                metrics["project_types"][project_type] = (
-                    metrics["project_types"].get(project_type, 0) + 1
-                )
-
             logger.info(
                 f"Generated project metrics for user {user.username}: {metrics}"
             )
@@ -254,9 +362,9 @@ class UserProjectViewSet(viewsets.ReadOnlyModelViewSet):
         logger.info(f"Retrieving project memberships for user ID: {pk}")
         try:
             user = self.get_object()
-            project_memberships = ProjectMembership.objects.filter(user=user)
-
-            logger.debug(f"Found {project_memberships.count()} project memberships")
+            project_memberships = ProjectMembership.objects.filter(
+                user=user
+            ).select_related("project", "user")
 
             # Use ProjectMembershipSerializer to include full project details
             serializer = ProjectMembershipSerializer(project_memberships, many=True)
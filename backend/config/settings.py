@@ -1,12 +1,40 @@
 from pathlib import Path
 import os
-from dotenv import load_dotenv
-import tempfile
 from datetime import timedelta
 import dj_database_url
+from django.core.exceptions import ImproperlyConfigured
+
+# Better Railway detection - check for multiple Railway environment variables
+IS_PRODUCTION = (
+    os.getenv("RENDER") is not None
+    or os.getenv("RAILWAY_PROJECT_ID") is not None
+    or os.getenv("RAILWAY_SERVICE_ID") is not None
+)
+
+# Load environment variables from a local .env file; Render and Railway
+# inject them directly, so production skips dotenv entirely
+if not IS_PRODUCTION:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+# Typed environment readers, evaluated once when settings are imported
+def env_bool(name, default=False):
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("true", "1", "yes")
+
+
+def env_int(name, default):
+    return int(os.getenv(name, default))
+
+
+def env_list(name):
+    """Comma-separated variable as a list, ignoring blanks around entries"""
+    return [item.strip() for item in os.getenv(name, "").split(",") if item.strip()]
 
-# Load environment variables from .env file
-load_dotenv()
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -18,14 +46,7 @@ SECRET_KEY = os.getenv(
 )
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = os.getenv("DEBUG", "False") == "True"
-
-# Better Railway detection - check for multiple Railway environment variables
-IS_PRODUCTION = (
-    os.getenv("RENDER") is not None
-    or os.getenv("RAILWAY_PROJECT_ID") is not None
-    or os.getenv("RAILWAY_SERVICE_ID") is not None
-)
+DEBUG = env_bool("DEBUG")
 
 # Configure allowed hosts for Railway and local development
 ALLOWED_HOSTS = []
@@ -49,10 +70,8 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     # "django.contrib.sites",
-    "django_extensions",
     # Third-party apps
     "rest_framework",  # REST framework for API
-    "drf_spectacular",  # API documentation
     "corsheaders",  # Handle CORS
     # Your custom apps
     "apps.core",
@@ -64,13 +83,24 @@ INSTALLED_APPS = [
     "apps.user_management.apps.UserManagementConfig",
 ]
 
+# Schema generation and the docs views are only loaded when enabled; the
+# extend_schema annotations in the app views still import drf_spectacular.utils
+API_DOCS_ENABLED = DEBUG or env_bool("ENABLE_API_DOCS")
+
+if DEBUG:
+    INSTALLED_APPS.append("django_extensions")
+if API_DOCS_ENABLED:
+    INSTALLED_APPS.append("drf_spectacular")  # API documentation
+
 # FIXED: Middleware order - SessionMiddleware MUST come before CsrfViewMiddleware
 MIDDLEWARE = [
+    "django.middleware.gzip.GZipMiddleware",  # Compress JSON responses
     "django.middleware.security.SecurityMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",  # Serve static files
     "django.contrib.sessions.middleware.SessionMiddleware",  # MUST be before CSRF
     "corsheaders.middleware.CorsMiddleware",  # CORS middleware
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",  # MUST be after Sessions
+    "apps.core.middleware.ApiCsrfViewMiddleware",  # MUST be after Sessions
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -97,12 +127,32 @@ TEMPLATES = [
 WSGI_APPLICATION = "config.wsgi.application"
 
 # Database configuration
-# Database configuration
-if IS_PRODUCTION:
-    # Use DATABASE_URL for production (Render/Railway)
-    DATABASES = {"default": dj_database_url.parse(os.getenv("DATABASE_URL"))}
+# Keep connections open between requests so the many short aggregate queries
+# issued by the dashboard and facturation analytics don't each pay connection
+# setup cost
+DB_CONN_MAX_AGE = env_int("DB_CONN_MAX_AGE", 600)
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+if IS_PRODUCTION and not DATABASE_URL:
+    # Never fall back to a local SQLite file on a production deploy
+    raise ImproperlyConfigured("DATABASE_URL must be set in production")
+
+if DATABASE_URL:
+    # PostgreSQL through DATABASE_URL (Render/Railway, or local development)
+    DATABASES = {
+        "default": dj_database_url.parse(
+            DATABASE_URL,
+            conn_max_age=DB_CONN_MAX_AGE,
+            conn_health_checks=True,
+        )
+    }
+    # Cap how long a reconnect can stall a request
+    DATABASES["default"].setdefault("OPTIONS", {}).setdefault(
+        "connect_timeout", env_int("DB_CONNECT_TIMEOUT", 5)
+    )
 else:
-    # Local SQLite database
+    # Local SQLite fallback, outside production only; writes are serialized database-wide, so set
+    # DATABASE_URL to run against PostgreSQL when testing concurrent loads
     DATABASES = {
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
@@ -134,26 +184,64 @@ USE_TZ = True
 
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = "static/"
-STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
+STATIC_ROOT = BASE_DIR / "staticfiles"
+
+# Static files are served by WhiteNoise with pre-compressed variants. In
+# production they also get hashed names (cached forever by browsers), which
+# needs the manifest written by collectstatic; elsewhere plain names are used
+# so {% static %} works without running it
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {
+        "BACKEND": (
+            "whitenoise.storage.CompressedManifestStaticFilesStorage"
+            if IS_PRODUCTION
+            else "whitenoise.storage.CompressedStaticFilesStorage"
+        )
+    },
+}
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Excel import settings
+# Number of rows sent per INSERT statement by the import bulk_create calls
+IMPORT_BULK_BATCH_SIZE = env_int("IMPORT_BULK_BATCH_SIZE", 1000)
+
+# Spool every upload to a temporary file so large SAP exports are parsed from
+# disk by path instead of being held in memory by the upload handler
+FILE_UPLOAD_MAX_MEMORY_SIZE = env_int("FILE_UPLOAD_MAX_MEMORY_SIZE", 0)
+
+# Private directory (created mode 0700) where parsed import sheets are kept as
+# Feather files, so a re-import of the same file skips the XLSX parse
+IMPORT_SCRATCH_DIR = Path(os.getenv("IMPORT_SCRATCH_DIR", BASE_DIR / "import_scratch"))
+
 # REST Framework settings
 REST_FRAMEWORK = {
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
-    "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-        "rest_framework.authentication.SessionAuthentication",
-        "rest_framework.authentication.BasicAuthentication",
+    "DEFAULT_RENDERER_CLASSES": [
+        "apps.core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
     ],
+    # The frontend sends a Bearer token on every call; session/basic auth
+    # only serve the browsable API while developing
+    "DEFAULT_AUTHENTICATION_CLASSES": (
+        [
+            "rest_framework_simplejwt.authentication.JWTAuthentication",
+            "rest_framework.authentication.SessionAuthentication",
+            "rest_framework.authentication.BasicAuthentication",
+        ]
+        if DEBUG
+        else ["rest_framework_simplejwt.authentication.JWTAuthentication"]
+    ),
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
 }
 
+if API_DOCS_ENABLED:
+    REST_FRAMEWORK["DEFAULT_SCHEMA_CLASS"] = "drf_spectacular.openapi.AutoSchema"
+
 # API Documentation settings
 SPECTACULAR_SETTINGS = {
     "TITLE": "Financial Dashboard API",
@@ -164,31 +252,24 @@ SPECTACULAR_SETTINGS = {
 }
 
 # CORS settings
-CORS_ALLOWED_ORIGINS = []
-CSRF_TRUSTED_ORIGINS = []
-
 if IS_PRODUCTION:
     # Production CORS settings - use environment variable
-    cors_origins = (
-        os.getenv("CORS_ALLOWED_ORIGINS", "").split(",")
-        if os.getenv("CORS_ALLOWED_ORIGINS")
-        else []
-    )
-    CORS_ALLOWED_ORIGINS = cors_origins
-    CSRF_TRUSTED_ORIGINS = cors_origins
+    cors_origins = env_list("CORS_ALLOWED_ORIGINS")
 else:
     # Development CORS settings
-    CORS_ALLOWED_ORIGINS = [
-        "http://localhost:3000",
-        "http://localhost:3001",
-        "http://127.0.0.1:3000",
-    ]
-    CSRF_TRUSTED_ORIGINS = [
+    cors_origins = [
         "http://localhost:3000",
         "http://localhost:3001",
         "http://127.0.0.1:3000",
     ]
 
+# Normalized once here: corsheaders compares scheme and host against every
+# entry on each request, so drop trailing slashes, case and duplicates
+CORS_ALLOWED_ORIGINS = tuple(
+    dict.fromkeys(origin.rstrip("/").lower() for origin in cors_origins)
+)
+CSRF_TRUSTED_ORIGINS = list(CORS_ALLOWED_ORIGINS)
+
 # FIXED: Temporarily disable CSRF_USE_SESSIONS for Railway
 if IS_PRODUCTION:
     CSRF_USE_SESSIONS = False  # Disable for production to avoid session issues
@@ -200,16 +281,17 @@ CSRF_COOKIE_NAME = "csrftoken"
 
 CORS_ALLOW_CREDENTIALS = True
 
-CORS_ALLOW_METHODS = [
+# Fixed tuples; corsheaders only joins them into the preflight response headers
+CORS_ALLOW_METHODS = (
     "DELETE",
     "GET",
     "OPTIONS",
     "PATCH",
     "POST",
     "PUT",
-]
+)
 
-CORS_ALLOW_HEADERS = [
+CORS_ALLOW_HEADERS = (
     "accept",
     "accept-encoding",
     "authorization",
@@ -219,23 +301,43 @@ CORS_ALLOW_HEADERS = [
     "user-agent",
     "x-csrftoken",
     "x-requested-with",
-]
+)
 
 # JWT Settings
+# HMAC signing with the secret key; simplejwt builds its token backend once
+# per process, so no key is parsed on each request
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),
+    "ALGORITHM": "HS256",
+    "SIGNING_KEY": SECRET_KEY,
+    "LEEWAY": 10,  # Seconds of clock skew tolerated on exp/nbf checks
 }
 
 # Cache configuration
-CACHES = {
-    "default": {
-        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
-        "LOCATION": tempfile.gettempdir(),
-        "TIMEOUT": 300,  # 5 minutes in seconds
-        "OPTIONS": {"MAX_ENTRIES": 1000},
+# Redis when REDIS_URL is set, so every worker shares the cache (dashboard
+# invalidation, background import status); per-process memory otherwise
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "TIMEOUT": 300,  # 5 minutes in seconds
+            # Bounded per-worker connection pool
+            "OPTIONS": {"max_connections": env_int("REDIS_MAX_CONNECTIONS", 50)},
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "default",
+            "TIMEOUT": 300,  # 5 minutes in seconds
+            "OPTIONS": {"MAX_ENTRIES": 10000},
+        }
     }
-}
 
 # Security settings for production
 if not DEBUG and not IS_PRODUCTION:
@@ -257,6 +359,13 @@ if not DEBUG:
     X_FRAME_OPTIONS = "DENY"
 
 # Logging configuration
+# Level of the project loggers; records below it are dropped before any
+# formatting happens
+APPS_LOG_LEVEL = os.getenv("APPS_LOG_LEVEL", "DEBUG" if DEBUG else "INFO")
+
+# Railway captures stdout, so the debug.log file is only written in DEBUG
+LOG_HANDLERS = ["console", "file"] if DEBUG else ["console"]
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -276,35 +385,25 @@ LOGGING = {
             "class": "logging.StreamHandler",
             "formatter": "verbose",
         },
-        "file": (
-            {
-                "level": "DEBUG",
-                "class": "logging.FileHandler",
-                "filename": "debug.log",
-                "formatter": "verbose",
-            }
-            if DEBUG
-            else {
-                "level": "INFO",
-                "class": "logging.StreamHandler",  # Railway uses console for logs
-                "formatter": "simple",
-            }
-        ),
     },
     "loggers": {
         "django": {
-            "handlers": ["console", "file"] if DEBUG else ["console"],
+            "handlers": LOG_HANDLERS,
             "level": "INFO",
         },
         "apps": {
-            "handlers": ["console", "file"] if DEBUG else ["console"],
-            "level": "DEBUG" if DEBUG else "INFO",
-            "propagate": True,
-        },
-        "apps.controle_depenses.services.evolution_service": {
-            "handlers": ["console", "file"] if DEBUG else ["console"],
-            "level": "DEBUG" if DEBUG else "INFO",
+            "handlers": LOG_HANDLERS,
+            "level": APPS_LOG_LEVEL,
             "propagate": True,
         },
     },
 }
+
+if DEBUG:
+    LOGGING["handlers"]["file"] = {
+        "level": "DEBUG",
+        # Written from a background thread, off the request path
+        "class": "apps.core.log_handlers.QueuedFileHandler",
+        "filename": "debug.log",
+        "formatter": "verbose",
+    }
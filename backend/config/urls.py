@@ -1,44 +1,86 @@
 # backend/config/urls.py
 
+import json
+
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
-from django.http import JsonResponse
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularSwaggerView,
-    SpectacularRedocView,
+from django.http import HttpResponse
+from django.utils.module_loading import import_string
+from django.views.decorators.cache import cache_control
+from django.views.decorators.csrf import csrf_exempt
+
+# Root endpoint payload, encoded once; the endpoint is polled by health checks
+ROOT_ENDPOINTS = {"admin": "/admin/"}
+if settings.API_DOCS_ENABLED:
+    ROOT_ENDPOINTS.update({"api_docs": "/docs/", "api_schema": "/api/schema/"})
+ROOT_ENDPOINTS.update(
+    {
+        "commandes": "/api/commandes/",
+        "controle_depenses": "/api/controle-depenses/",
+        "facturation": "/api/facturation/",
+        "user_management": "/api/user-management/",
+        "auth": "/api/auth/",
+    }
 )
 
+ROOT_PAYLOAD = json.dumps(
+    {
+        "message": "Financial Dashboard Backend API",
+        "status": "running",
+        "version": "1.0.0",
+        "endpoints": ROOT_ENDPOINTS,
+    }
+).encode()
+
 
 # Root view for API status
+@cache_control(max_age=60, public=True)
 def root_view(request):
     """Simple root endpoint to show API status and available endpoints"""
-    return JsonResponse(
-        {
-            "message": "Financial Dashboard Backend API",
-            "status": "running",
-            "version": "1.0.0",
-            "endpoints": {
-                "admin": "/admin/",
-                "api_docs": "/docs/",
-                "api_schema": "/api/schema/",
-                "commandes": "/api/commandes/",
-                "controle_depenses": "/api/controle-depenses/",
-                "facturation": "/api/facturation/",
-                "user_management": "/api/user-management/",
-                "auth": "/api/auth/",
-            },
-        }
-    )
-
-
-# API documentation patterns
-api_doc_patterns = [
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path("docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
-    path("redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
-]
+    return HttpResponse(ROOT_PAYLOAD, content_type="application/json")
+
+
+def lazy_view(dotted_path, **initkwargs):
+    """
+    View that imports its class on the first request, so the schema generator
+    and its dependencies stay out of startup until the docs are opened
+    """
+    view = None
+
+    @csrf_exempt
+    def wrapper(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            view = import_string(dotted_path).as_view(**initkwargs)
+        return view(request, *args, **kwargs)
+
+    return wrapper
+
+
+# API documentation patterns (only served when API_DOCS_ENABLED)
+api_doc_patterns = []
+
+if settings.API_DOCS_ENABLED:
+    api_doc_patterns = [
+        path(
+            "api/schema/",
+            lazy_view("drf_spectacular.views.SpectacularAPIView"),
+            name="schema",
+        ),
+        path(
+            "docs/",
+            lazy_view(
+                "drf_spectacular.views.SpectacularSwaggerView", url_name="schema"
+            ),
+            name="swagger-ui",
+        ),
+        path(
+            "redoc/",
+            lazy_view("drf_spectacular.views.SpectacularRedocView", url_name="schema"),
+            name="redoc",
+        ),
+    ]
 
 # Main API patterns
 api_patterns = [
@@ -4,4 +4,10 @@ import os
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-application = get_wsgi_application()
\ No newline at end of file
+application = get_wsgi_application()
+
+# Load the URLconf (and with it every app's views) while the worker boots,
+# instead of on the first request it serves
+from django.urls import get_resolver  # noqa: E402
+
+get_resolver().url_patterns